@@ -32,6 +32,10 @@ async def lifespan(app: FastAPI):
     yield
     logger.info("Clarvis API server shutting down...")
 
+    from ..ski_agent import close_http_client
+
+    await close_http_client()
+
 
 def create_app() -> FastAPI:
     """
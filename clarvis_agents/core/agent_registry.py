@@ -10,13 +10,24 @@ class AgentRegistry:
 
     _instance: Optional["AgentRegistry"] = None
     _agents: dict[str, BaseAgent]
+    _version: int
 
     def __new__(cls) -> "AgentRegistry":
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._agents = {}
+            cls._instance._version = 0
         return cls._instance
 
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever the set of registered agents changes.
+
+        Lets callers cache values derived from the registry and invalidate
+        them cheaply.
+        """
+        return self._version
+
     def register(self, agent: BaseAgent) -> None:
         """Register an agent by its name.
 
@@ -24,6 +35,7 @@ class AgentRegistry:
             agent: The agent to register.
         """
         self._agents[agent.name] = agent
+        self._version += 1
 
     def unregister(self, name: str) -> None:
         """Remove an agent from the registry.
@@ -33,6 +45,7 @@ class AgentRegistry:
         """
         if name in self._agents:
             del self._agents[name]
+            self._version += 1
 
     def get(self, name: str) -> Optional[BaseAgent]:
         """Get an agent by name.
@@ -69,9 +82,21 @@ class AgentRegistry:
         """
         return {name: agent.health_check() for name, agent in self._agents.items()}
 
+    def health_check_any(self) -> bool:
+        """Check whether at least one registered agent is healthy.
+
+        Stops at the first healthy agent instead of checking all of them.
+
+        Returns:
+            True if any agent reports healthy, False otherwise (including
+            when no agents are registered).
+        """
+        return any(agent.health_check() for agent in self._agents.values())
+
     def clear(self) -> None:
         """Clear all registered agents (useful for testing)."""
         self._agents.clear()
+        self._version += 1
 
     @classmethod
     def reset_instance(cls) -> None:
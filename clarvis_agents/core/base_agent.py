@@ -74,6 +74,17 @@ class BaseAgent(ABC):
         """
         ...
 
+    def prefetch(self, query: str) -> None:
+        """Start loading data for a query that has been routed to this agent.
+
+        This is an optional hook, called before the routing announcement is
+        delivered, so slow I/O can overlap with it. It must not block.
+        Default implementation does nothing.
+
+        Args:
+            query: The user's query that will be processed next.
+        """
+
     async def stream(
         self, query: str, context: Optional["ConversationContext"] = None
     ) -> AsyncGenerator[str, None]:
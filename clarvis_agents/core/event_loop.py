@@ -0,0 +1,134 @@
+"""Event loop selection for the agents' synchronous entry points."""
+
+import asyncio
+import atexit
+import threading
+import weakref
+from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine
+from typing import Any, Generic, TypeVar
+
+# uvloop is an optional, faster event loop; asyncio's default is used without it
+try:
+    import uvloop
+
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+T = TypeVar("T")
+
+# One persistent runner per thread; a Runner's loop can't be shared across threads
+_local = threading.local()
+
+
+def _get_runner() -> asyncio.Runner:
+    """Get this thread's runner, creating it on first use.
+
+    Returns:
+        asyncio.Runner that is closed at interpreter exit.
+    """
+    runner = getattr(_local, "runner", None)
+    if runner is None:
+        loop_factory = uvloop.new_event_loop if HAS_UVLOOP else None
+        runner = asyncio.Runner(loop_factory=loop_factory)
+        atexit.register(runner.close)
+        _local.runner = runner
+    return runner
+
+
+def run_coroutine(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on this thread's persistent event loop.
+
+    Replacement for asyncio.run() that keeps the loop between calls, so
+    loop-bound state such as pooled HTTP connections and background cache
+    refreshes carries over from one call to the next. The loop is uvloop's
+    when it is installed. The process-wide event loop policy is left alone,
+    so hosts that pick their own loop (uvicorn, Home Assistant) are
+    unaffected.
+
+    Args:
+        coro: Coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    return _get_runner().run(coro)
+
+
+class LoopLocal(Generic[T]):
+    """One lazily created resource per event loop, closed when that loop shuts down.
+
+    Loop-bound resources such as httpx connection pools hold a strong
+    reference to their loop through their open connections, so they can't be
+    keyed on the loop in a WeakKeyDictionary: the entry would keep its own key
+    alive. Entries are keyed by id(loop) instead and removed by a shutdown
+    hook. The hook is a parked async generator, which the loop finalizes in
+    shutdown_asyncgens(); asyncio.run(), asyncio.Runner.close() and therefore
+    run_coroutine's runners all call it. A loop closed without that step keeps
+    its resource alive.
+    """
+
+    def __init__(
+        self, factory: Callable[[], T], close: Callable[[T], Awaitable[Any]]
+    ) -> None:
+        """Initialize the per-loop slot.
+
+        Args:
+            factory: Creates the resource for a loop on first use.
+            close: Closes a resource; awaited on the resource's own loop.
+        """
+        self._factory = factory
+        self._close = close
+        # id(loop) -> (weak loop reference, resource, shutdown hook)
+        self._entries: dict[
+            int,
+            tuple[
+                weakref.ref[asyncio.AbstractEventLoop],
+                T,
+                AsyncGenerator[None, None],
+            ],
+        ] = {}
+
+    def __len__(self) -> int:
+        """Return the number of loops with an open resource."""
+        return len(self._entries)
+
+    def get(self) -> T:
+        """Get the running loop's resource, creating it on first use.
+
+        Returns:
+            The resource for the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._entries.get(id(loop))
+        if entry is not None and entry[0]() is loop:
+            return entry[1]
+
+        resource = self._factory()
+        hook = self._close_at_shutdown(id(loop), resource)
+        # Run the hook up to its yield so the loop tracks it as a live async
+        # generator; it resumes only when the loop or aclose() finalizes it
+        try:
+            hook.asend(None).send(None)
+        except StopIteration:
+            pass
+        self._entries[id(loop)] = (weakref.ref(loop), resource, hook)
+        return resource
+
+    async def aclose(self) -> None:
+        """Close the running loop's resource now, if it has one."""
+        entry = self._entries.get(id(asyncio.get_running_loop()))
+        if entry is not None:
+            await entry[2].aclose()
+
+    async def _close_at_shutdown(
+        self, key: int, resource: T
+    ) -> AsyncGenerator[None, None]:
+        """Wait for finalization, then forget and close the resource."""
+        try:
+            yield
+        finally:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is resource:
+                del self._entries[key]
+            await self._close(resource)
@@ -1,6 +1,5 @@
 """Gmail Agent implementation using Claude Agent SDK."""
 
-import asyncio
 import logging
 import os
 from pathlib import Path
@@ -12,15 +11,44 @@ from claude_agent_sdk import query, ClaudeAgentOptions, ClaudeSDKClient
 
 from ..core import BaseAgent, AgentResponse, AgentCapability
 from ..core.context import ConversationContext
+from ..core.event_loop import run_coroutine
 from .config import GmailAgentConfig, RateLimiter
 from .prompts import SYSTEM_PROMPT
 
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# Setup logging. Levels and console output are left to the application
+# (see the __main__ block).
 logger = logging.getLogger(__name__)
 
 
+_CAPABILITIES: tuple[AgentCapability, ...] = (
+    AgentCapability(
+        name="check_inbox",
+        description="Check inbox for new or unread emails",
+        keywords=["inbox", "unread", "new emails", "messages"],
+        examples=["Check my unread emails", "Any new messages?"],
+    ),
+    AgentCapability(
+        name="search_emails",
+        description="Search emails by sender, subject, date, or keywords",
+        keywords=["search", "find", "emails from", "emails about"],
+        examples=["Find emails from John", "Search for project updates"],
+    ),
+    AgentCapability(
+        name="read_email",
+        description="Read full email content and threads",
+        keywords=["read", "show", "open", "content"],
+        examples=["Read the latest email", "Show me that thread"],
+    ),
+    AgentCapability(
+        name="summarize",
+        description="Summarize emails or threads",
+        keywords=["summarize", "summary", "overview"],
+        examples=["Summarize my recent emails", "Give me an overview"],
+    ),
+)
+
+
 class GmailAgent(BaseAgent):
     """Gmail checking agent using Claude Agent SDK."""
 
@@ -53,32 +81,7 @@ class GmailAgent(BaseAgent):
     @property
     def capabilities(self) -> list[AgentCapability]:
         """List of capabilities this agent provides."""
-        return [
-            AgentCapability(
-                name="check_inbox",
-                description="Check inbox for new or unread emails",
-                keywords=["inbox", "unread", "new emails", "messages"],
-                examples=["Check my unread emails", "Any new messages?"],
-            ),
-            AgentCapability(
-                name="search_emails",
-                description="Search emails by sender, subject, date, or keywords",
-                keywords=["search", "find", "emails from", "emails about"],
-                examples=["Find emails from John", "Search for project updates"],
-            ),
-            AgentCapability(
-                name="read_email",
-                description="Read full email content and threads",
-                keywords=["read", "show", "open", "content"],
-                examples=["Read the latest email", "Show me that thread"],
-            ),
-            AgentCapability(
-                name="summarize",
-                description="Summarize emails or threads",
-                keywords=["summarize", "summary", "overview"],
-                examples=["Summarize my recent emails", "Give me an overview"],
-            ),
-        ]
+        return list(_CAPABILITIES)
 
     async def process(
         self, query: str, context: Optional[ConversationContext] = None
@@ -161,6 +164,19 @@ class GmailAgent(BaseAgent):
         self.config.log_dir.mkdir(parents=True, exist_ok=True)
 
         log_file = self.config.log_dir / f"access_{datetime.now():%Y%m%d}.log"
+        # Agents can be created many times per process; keep one handler per
+        # log directory, moving it to today's file once the date has changed.
+        # A long-lived agent still writes to the file of the day it was made.
+        log_path = os.path.abspath(log_file)
+        for handler in list(logger.handlers):
+            if isinstance(handler, logging.FileHandler) and os.path.dirname(
+                handler.baseFilename
+            ) == os.path.dirname(log_path):
+                if handler.baseFilename == log_path:
+                    return
+                logger.removeHandler(handler)
+                handler.close()
+
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(
             logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -262,7 +278,7 @@ class GmailAgent(BaseAgent):
         Returns:
             Agent's response as string
         """
-        return asyncio.run(self._check_emails_async(query))
+        return run_coroutine(self._check_emails_async(query))
 
     async def run_interactive_async(self) -> None:
         """Run agent in interactive mode with context retention."""
@@ -320,7 +336,7 @@ class GmailAgent(BaseAgent):
 
     def run_interactive(self) -> None:
         """Run agent in interactive mode (synchronous wrapper)."""
-        asyncio.run(self.run_interactive_async())
+        run_coroutine(self.run_interactive_async())
 
 
 def create_gmail_agent(read_only: bool = True) -> GmailAgent:
@@ -339,5 +355,6 @@ def create_gmail_agent(read_only: bool = True) -> GmailAgent:
 
 # Main entry point for running as a module
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     agent = create_gmail_agent()
     agent.run_interactive()
@@ -1,9 +1,10 @@
 """Configuration for Gmail Agent."""
 
+import time
 from dataclasses import dataclass
 from typing import Dict, Any
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import timedelta
 from collections import deque
 
 
@@ -20,7 +21,9 @@ class RateLimiter:
         """
         self.max_calls = max_calls
         self.time_window = time_window
-        self.calls = deque()
+        self._window_seconds = time_window.total_seconds()
+        # time.monotonic() timestamps of the calls inside the window
+        self.calls: deque[float] = deque()
 
     def check_rate_limit(self) -> bool:
         """
@@ -29,10 +32,11 @@ class RateLimiter:
         Returns:
             True if within rate limit, False otherwise
         """
-        now = datetime.now()
+        now = time.monotonic()
 
         # Remove old calls outside the time window
-        while self.calls and self.calls[0] < now - self.time_window:
+        window_start = now - self._window_seconds
+        while self.calls and self.calls[0] < window_start:
             self.calls.popleft()
 
         # Check if we've exceeded the limit
@@ -1,6 +1,5 @@
 """Notes Agent implementation for managing notes, lists, and reminders."""
 
-import asyncio
 import logging
 import os
 from datetime import datetime, timedelta
@@ -10,6 +9,7 @@ from anthropic import Anthropic
 
 from ..core import AgentCapability, AgentResponse, BaseAgent
 from ..core.context import ConversationContext
+from ..core.event_loop import run_coroutine
 from .config import NotesAgentConfig, RateLimiter
 from .prompts import SYSTEM_PROMPT
 from .storage import NotesStorage
@@ -25,11 +25,39 @@ from .tools import (
     update_note_impl,
 )
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# Setup logging. Levels and console output are left to the application
+# (see the __main__ block).
 logger = logging.getLogger(__name__)
 
 
+_CAPABILITIES: tuple[AgentCapability, ...] = (
+    AgentCapability(
+        name="manage_lists",
+        description="Create and manage lists like grocery, shopping, or to-do",
+        keywords=["list", "grocery", "shopping", "todo", "add", "remove"],
+        examples=["Add milk to my grocery list", "What's on my shopping list?"],
+    ),
+    AgentCapability(
+        name="reminders",
+        description="Store and retrieve reminders",
+        keywords=["remind", "reminder", "remember", "don't forget"],
+        examples=["Remind me to call the dentist", "What are my reminders?"],
+    ),
+    AgentCapability(
+        name="notes",
+        description="Save and retrieve general notes and information",
+        keywords=["note", "save", "remember", "code", "information"],
+        examples=["Take a note: the garage code is 1234", "What's the garage code?"],
+    ),
+    AgentCapability(
+        name="list_management",
+        description="View, clear, and delete notes and lists",
+        keywords=["show", "clear", "delete", "what notes"],
+        examples=["What notes do I have?", "Clear my grocery list"],
+    ),
+)
+
+
 class NotesAgent(BaseAgent):
     """Notes and lists management agent."""
 
@@ -72,32 +100,7 @@ class NotesAgent(BaseAgent):
     @property
     def capabilities(self) -> list[AgentCapability]:
         """List of capabilities this agent provides."""
-        return [
-            AgentCapability(
-                name="manage_lists",
-                description="Create and manage lists like grocery, shopping, or to-do",
-                keywords=["list", "grocery", "shopping", "todo", "add", "remove"],
-                examples=["Add milk to my grocery list", "What's on my shopping list?"],
-            ),
-            AgentCapability(
-                name="reminders",
-                description="Store and retrieve reminders",
-                keywords=["remind", "reminder", "remember", "don't forget"],
-                examples=["Remind me to call the dentist", "What are my reminders?"],
-            ),
-            AgentCapability(
-                name="notes",
-                description="Save and retrieve general notes and information",
-                keywords=["note", "save", "remember", "code", "information"],
-                examples=["Take a note: the garage code is 1234", "What's the garage code?"],
-            ),
-            AgentCapability(
-                name="list_management",
-                description="View, clear, and delete notes and lists",
-                keywords=["show", "clear", "delete", "what notes"],
-                examples=["What notes do I have?", "Clear my grocery list"],
-            ),
-        ]
+        return list(_CAPABILITIES)
 
     async def process(
         self, query_text: str, context: Optional[ConversationContext] = None
@@ -199,6 +202,19 @@ class NotesAgent(BaseAgent):
         self.config.log_dir.mkdir(parents=True, exist_ok=True)
 
         log_file = self.config.log_dir / f"access_{datetime.now():%Y%m%d}.log"
+        # Agents can be created many times per process; keep one handler per
+        # log directory, moving it to today's file once the date has changed.
+        # A long-lived agent still writes to the file of the day it was made.
+        log_path = os.path.abspath(log_file)
+        for handler in list(logger.handlers):
+            if isinstance(handler, logging.FileHandler) and os.path.dirname(
+                handler.baseFilename
+            ) == os.path.dirname(log_path):
+                if handler.baseFilename == log_path:
+                    return
+                logger.removeHandler(handler)
+                handler.close()
+
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(
             logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
@@ -414,7 +430,7 @@ class NotesAgent(BaseAgent):
         Returns:
             Agent's response as string
         """
-        return asyncio.run(self._handle_query(query_text))
+        return run_coroutine(self._handle_query(query_text))
 
 
 def create_notes_agent(config: Optional[NotesAgentConfig] = None) -> NotesAgent:
@@ -430,5 +446,6 @@ def create_notes_agent(config: Optional[NotesAgentConfig] = None) -> NotesAgent:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     agent = create_notes_agent()
     print(agent.handle_query("Add milk to my grocery list"))
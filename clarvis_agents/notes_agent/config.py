@@ -1,8 +1,9 @@
 """Configuration for Notes Agent."""
 
+import time
 from collections import deque
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import timedelta
 from pathlib import Path
 
 
@@ -18,7 +19,9 @@ class RateLimiter:
         """
         self.max_calls = max_calls
         self.time_window = time_window
-        self.calls: deque[datetime] = deque()
+        self._window_seconds = time_window.total_seconds()
+        # time.monotonic() timestamps of the calls inside the window
+        self.calls: deque[float] = deque()
 
     def check_rate_limit(self) -> bool:
         """Check if we're within rate limit.
@@ -26,10 +29,11 @@ class RateLimiter:
         Returns:
             True if within rate limit, False otherwise
         """
-        now = datetime.now()
+        now = time.monotonic()
 
         # Remove old calls outside the time window
-        while self.calls and self.calls[0] < now - self.time_window:
+        window_start = now - self._window_seconds
+        while self.calls and self.calls[0] < window_start:
             self.calls.popleft()
 
         # Check if we've exceeded the limit
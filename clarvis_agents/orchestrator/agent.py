@@ -1,11 +1,10 @@
 """Orchestrator agent for coordinating multi-agent responses."""
 
+import asyncio
 import logging
 import os
-from datetime import datetime, timedelta
-from typing import AsyncGenerator, Optional
-
-from anthropic import Anthropic
+import time
+from typing import TYPE_CHECKING, AsyncGenerator, Optional
 
 from ..core import (
     AgentCapability,
@@ -14,9 +13,16 @@ from ..core import (
     BaseAgent,
     ConversationContext,
 )
+from ..core.event_loop import LoopLocal
 from .config import OrchestratorConfig, load_config
+from .prompts import DIRECT_SYSTEM_PROMPT, RECENT_CONTEXT_TEMPLATE
 from .router import IntentRouter, RoutingDecision
 
+if TYPE_CHECKING:
+    # Imported lazily in _get_shared_client: the SDK is heavy and many code paths
+    # (classification, fallback, delegation) never need it
+    from anthropic import AsyncAnthropic
+
 logger = logging.getLogger(__name__)
 
 # Routing announcements for voice feedback when delegating to agents
@@ -28,6 +34,84 @@ ROUTING_ANNOUNCEMENTS = {
     "notes": "Checking your notes. ",
 }
 
+# Connection pool for the shared Anthropic client. Keeping connections alive
+# between direct responses avoids a fresh TLS handshake per burst of queries.
+HTTP_MAX_CONNECTIONS = 64
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 120.0
+
+
+async def _close_clients(clients: dict[str, "AsyncAnthropic"]) -> None:
+    """Close every shared client of one event loop."""
+    for client in clients.values():
+        await client.close()
+
+
+# API key -> shared client, per event loop. An httpx pool is bound to the loop
+# it first runs on, so each loop gets its own, closed when the loop shuts down.
+_shared_clients: LoopLocal[dict[str, "AsyncAnthropic"]] = LoopLocal(
+    dict, _close_clients
+)
+
+
+def _get_shared_client(api_key: str) -> "AsyncAnthropic":
+    """Get the async Anthropic client for an API key on the running event loop.
+
+    Orchestrator instances using the same key on the same loop share one
+    client, and so one pool of keep-alive connections.
+
+    Args:
+        api_key: Anthropic API key.
+
+    Returns:
+        AsyncAnthropic client instance.
+    """
+    clients = _shared_clients.get()
+    client = clients.get(api_key)
+    if client is not None:
+        return client
+
+    import httpx
+    from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
+
+    http_client = DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+    client = AsyncAnthropic(api_key=api_key, http_client=http_client)
+    clients[api_key] = client
+    return client
+
+
+# Built once at import; the capabilities property hands out copies of this
+_CAPABILITIES: tuple[AgentCapability, ...] = (
+    AgentCapability(
+        name="query_routing",
+        description="Routes queries to appropriate specialist agents",
+        keywords=["help", "assist", "question"],
+        examples=["check my emails", "what's the weather", "hello"],
+    ),
+    AgentCapability(
+        name="conversation_management",
+        description="Manages multi-turn conversations with context",
+        keywords=["follow-up", "more", "continue"],
+        examples=["tell me more", "what about the first one"],
+    ),
+)
+
+
+class _SessionEntry:
+    """A live session and its expiry time (time.monotonic() seconds)."""
+
+    __slots__ = ("context", "expires_at")
+
+    def __init__(self, context: ConversationContext, expires_at: float) -> None:
+        self.context = context
+        self.expires_at = expires_at
+
 
 class OrchestratorAgent(BaseAgent):
     """Central orchestrator that routes queries to appropriate agents.
@@ -44,7 +128,7 @@ class OrchestratorAgent(BaseAgent):
         config: OrchestratorConfig,
         registry: AgentRegistry,
         router: Optional[IntentRouter] = None,
-        anthropic_client: Optional[Anthropic] = None,
+        anthropic_client: Optional["AsyncAnthropic"] = None,
     ) -> None:
         """Initialize the orchestrator.
 
@@ -52,14 +136,16 @@ class OrchestratorAgent(BaseAgent):
             config: Orchestrator configuration.
             registry: Agent registry with available agents.
             router: Optional custom router. Defaults to IntentRouter.
-            anthropic_client: Optional Anthropic client for direct handling.
+            anthropic_client: Optional async Anthropic client for direct handling.
         """
         self._config = config
         self._registry = registry
         self._router = router or IntentRouter(registry, config)
         self._client = anthropic_client
-        self._sessions: dict[str, ConversationContext] = {}
-        self._session_timestamps: dict[str, datetime] = {}
+        self._sessions: dict[str, _SessionEntry] = {}
+        self._session_timeout_seconds = config.session_timeout_minutes * 60.0
+        # (registry version, fallback message) for the current agent set
+        self._fallback_cache: Optional[tuple[int, str]] = None
 
     @property
     def name(self) -> str:
@@ -74,20 +160,7 @@ class OrchestratorAgent(BaseAgent):
     @property
     def capabilities(self) -> list[AgentCapability]:
         """List of capabilities this agent provides."""
-        return [
-            AgentCapability(
-                name="query_routing",
-                description="Routes queries to appropriate specialist agents",
-                keywords=["help", "assist", "question"],
-                examples=["check my emails", "what's the weather", "hello"],
-            ),
-            AgentCapability(
-                name="conversation_management",
-                description="Manages multi-turn conversations with context",
-                keywords=["follow-up", "more", "continue"],
-                examples=["tell me more", "what about the first one"],
-            ),
-        ]
+        return list(_CAPABILITIES)
 
     def health_check(self) -> bool:
         """Check if orchestrator and all registered agents are healthy.
@@ -96,11 +169,9 @@ class OrchestratorAgent(BaseAgent):
             True if the orchestrator is operational.
         """
         try:
-            # Check registry is accessible
-            agent_health = self._registry.health_check_all()
             # Orchestrator is healthy if at least one agent is healthy
             # or if no agents are registered yet
-            return any(agent_health.values()) if agent_health else True
+            return self._registry.health_check_any() or not self._registry.list_agents()
         except Exception:
             return False
 
@@ -118,10 +189,12 @@ class OrchestratorAgent(BaseAgent):
         # Clean up expired sessions first
         self._cleanup_expired_sessions()
 
-        if session_id and session_id in self._sessions:
-            # Update timestamp
-            self._session_timestamps[session_id] = datetime.now()
-            return self._sessions[session_id]
+        expires_at = time.monotonic() + self._session_timeout_seconds
+        entry = self._sessions.get(session_id) if session_id else None
+        if entry is not None:
+            # Extend the session's lifetime
+            entry.expires_at = expires_at
+            return entry.context
 
         # Create new session
         if session_id:
@@ -129,41 +202,60 @@ class OrchestratorAgent(BaseAgent):
         else:
             context = ConversationContext()
 
-        self._sessions[context.session_id] = context
-        self._session_timestamps[context.session_id] = datetime.now()
+        self._sessions[context.session_id] = _SessionEntry(context, expires_at)
         return context
 
     def _cleanup_expired_sessions(self) -> None:
         """Remove sessions that have exceeded the timeout."""
-        timeout = timedelta(minutes=self._config.session_timeout_minutes)
-        now = datetime.now()
+        now = time.monotonic()
 
         expired = [
-            sid
-            for sid, timestamp in self._session_timestamps.items()
-            if now - timestamp > timeout
+            sid for sid, entry in self._sessions.items() if now > entry.expires_at
         ]
 
         for sid in expired:
             del self._sessions[sid]
-            del self._session_timestamps[sid]
             logger.debug(f"Cleaned up expired session: {sid}")
 
-    def _get_client(self) -> Anthropic:
-        """Get or create Anthropic client.
+    def _get_client(self) -> "AsyncAnthropic":
+        """Get the async Anthropic client for the running event loop.
+
+        An injected client is always used as-is. Otherwise the shared client
+        is looked up on each call rather than stored, so an orchestrator used
+        from several event loops never crosses their connection pools.
 
         Returns:
-            Anthropic client instance.
+            AsyncAnthropic client instance.
 
         Raises:
             ValueError: If ANTHROPIC_API_KEY is not set.
         """
-        if self._client is None:
-            api_key = os.environ.get("ANTHROPIC_API_KEY")
-            if not api_key:
-                raise ValueError("ANTHROPIC_API_KEY environment variable not set")
-            self._client = Anthropic(api_key=api_key)
-        return self._client
+        if self._client is not None:
+            return self._client
+        api_key = os.environ.get("ANTHROPIC_API_KEY")
+        if not api_key:
+            raise ValueError("ANTHROPIC_API_KEY environment variable not set")
+        return _get_shared_client(api_key)
+
+    @staticmethod
+    def _build_direct_messages(
+        query: str, context: ConversationContext
+    ) -> list[dict[str, str]]:
+        """Build the message list for direct handling.
+
+        Args:
+            query: The user's query.
+            context: Conversation context; recent turns are included if any.
+
+        Returns:
+            Messages list for the Anthropic API.
+        """
+        if context.turns:
+            recent = context.get_recent_context(n=2)
+            content = RECENT_CONTEXT_TEMPLATE.format(recent=recent, query=query)
+        else:
+            content = query
+        return [{"role": "user", "content": content}]
 
     async def _handle_direct(
         self,
@@ -184,35 +276,11 @@ class OrchestratorAgent(BaseAgent):
         try:
             client = self._get_client()
 
-            # Build system prompt with voice guidelines
-            system_prompt = """You are Clarvis, a helpful AI home assistant.
-You can help with email, calendar, weather, and other tasks through specialized agents.
-For greetings, thanks, and general questions, respond naturally and helpfully.
-
-VOICE OUTPUT GUIDELINES:
-- Keep responses concise (1-2 sentences)
-- Do NOT end with questions unless you need clarification to proceed
-- Do NOT offer follow-up options like "Would you like..." or "Let me know if..."
-- Use natural, conversational language appropriate for spoken output"""
-
-            # Include recent context
-            messages = []
-            if context.turns:
-                recent = context.get_recent_context(n=2)
-                messages.append(
-                    {
-                        "role": "user",
-                        "content": f"Recent conversation:\n{recent}\n\nNew query: {query}",
-                    }
-                )
-            else:
-                messages.append({"role": "user", "content": query})
-
-            response = client.messages.create(
+            response = await client.messages.create(
                 model=self._config.model,
                 max_tokens=500,
-                system=system_prompt,
-                messages=messages,
+                system=DIRECT_SYSTEM_PROMPT,
+                messages=self._build_direct_messages(query, context),
             )
 
             content = (
@@ -275,21 +343,18 @@ VOICE OUTPUT GUIDELINES:
                 error=str(e),
             )
 
-    async def _handle_fallback(
-        self,
-        query: str,
-        context: ConversationContext,
-    ) -> AgentResponse:
-        """Handle queries that couldn't be routed to any agent.
+    def _fallback_content(self) -> str:
+        """Build the fallback message listing available agents.
 
-        Args:
-            query: The user's query.
-            context: Conversation context.
+        The message only depends on the registered agents, so it is cached
+        until the registry version changes.
 
         Returns:
-            AgentResponse with fallback message.
+            Fallback message for queries no agent could handle.
         """
-        logger.info("Using fallback handling for unmatched query")
+        version = self._registry.version
+        if self._fallback_cache is not None and self._fallback_cache[0] == version:
+            return self._fallback_cache[1]
 
         # List available agents for user guidance
         available_agents = self._registry.list_agents()
@@ -307,8 +372,27 @@ VOICE OUTPUT GUIDELINES:
                 "Could you try rephrasing your question?"
             )
 
+        self._fallback_cache = (version, content)
+        return content
+
+    async def _handle_fallback(
+        self,
+        query: str,
+        context: ConversationContext,
+    ) -> AgentResponse:
+        """Handle queries that couldn't be routed to any agent.
+
+        Args:
+            query: The user's query.
+            context: Conversation context.
+
+        Returns:
+            AgentResponse with fallback message.
+        """
+        logger.info("Using fallback handling for unmatched query")
+
         return AgentResponse(
-            content=content,
+            content=self._fallback_content(),
             success=True,
             agent_name=self.name,
             metadata={"fallback": True},
@@ -387,7 +471,7 @@ VOICE OUTPUT GUIDELINES:
             f"Streaming query: {query[:50]}... (session: {context.session_id})"
         )
 
-        collected_response = ""
+        chunks: list[str] = []
 
         try:
             # Route the query
@@ -397,27 +481,131 @@ VOICE OUTPUT GUIDELINES:
             # Stream based on decision
             if decision.handle_directly:
                 async for chunk in self._stream_direct(query, context):
-                    collected_response += chunk
+                    chunks.append(chunk)
                     yield chunk
             elif decision.agent_name:
                 async for chunk in self._stream_single_agent(
                     query, decision, context
                 ):
-                    collected_response += chunk
+                    chunks.append(chunk)
                     yield chunk
             else:
                 async for chunk in self._stream_fallback(query, context):
-                    collected_response += chunk
+                    chunks.append(chunk)
                     yield chunk
 
             # Update context with the complete response
-            context.add_turn(query, collected_response, decision.agent_name or self.name)
+            context.add_turn(query, "".join(chunks), decision.agent_name or self.name)
 
         except Exception as e:
             logger.error(f"Error streaming query: {e}", exc_info=True)
             error_msg = "I'm sorry, I encountered an error processing your request."
             yield error_msg
 
+    def _prepare_batch(
+        self, queries: list[tuple[str, Optional[str]]], max_concurrency: int
+    ) -> list[tuple[str, ConversationContext, asyncio.Lock]]:
+        """Resolve sessions for a batch before any query runs.
+
+        Sessions are created up front so concurrent tasks never race on
+        get_or_create_session. Queries sharing a session share a lock, so
+        they run one at a time in submission order.
+
+        Args:
+            queries: List of (query, session_id) tuples.
+            max_concurrency: Maximum number of queries in flight.
+
+        Returns:
+            List of (query, context, session lock) tuples.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        locks: dict[str, asyncio.Lock] = {}
+        prepared = []
+        for query, session_id in queries:
+            context = self.get_or_create_session(session_id)
+            lock = locks.setdefault(context.session_id, asyncio.Lock())
+            prepared.append((query, context, lock))
+        return prepared
+
+    async def batch_process(
+        self,
+        queries: list[tuple[str, Optional[str]]],
+        max_concurrency: int = 8,
+    ) -> list[AgentResponse]:
+        """Process several queries concurrently.
+
+        Args:
+            queries: List of (query, session_id) tuples. A session_id of None
+                starts a new session for that query.
+            max_concurrency: Maximum number of queries processed at once.
+
+        Returns:
+            AgentResponses in the same order as the queries.
+        """
+        prepared = self._prepare_batch(queries, max_concurrency)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _run(
+            query: str, context: ConversationContext, lock: asyncio.Lock
+        ) -> AgentResponse:
+            async with lock, semaphore:
+                return await self.process(query, context=context)
+
+        return list(await asyncio.gather(*(_run(*item) for item in prepared)))
+
+    async def batch_stream(
+        self,
+        queries: list[tuple[str, Optional[str]]],
+        max_concurrency: int = 8,
+    ) -> AsyncGenerator[tuple[int, str], None]:
+        """Stream several queries concurrently, multiplexed into one stream.
+
+        Args:
+            queries: List of (query, session_id) tuples. A session_id of None
+                starts a new session for that query.
+            max_concurrency: Maximum number of queries streamed at once.
+
+        Yields:
+            (index, chunk) tuples, where index is the position of the query
+            in the input list. Chunks for a given index arrive in order.
+        """
+        prepared = self._prepare_batch(queries, max_concurrency)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        queue: asyncio.Queue[tuple[int, Optional[str]]] = asyncio.Queue()
+
+        async def _pump(
+            index: int, query: str, context: ConversationContext, lock: asyncio.Lock
+        ) -> None:
+            try:
+                async with lock, semaphore:
+                    async for chunk in self.stream(query, context=context):
+                        await queue.put((index, chunk))
+            finally:
+                # None marks the end of this query's stream
+                await queue.put((index, None))
+
+        tasks = [
+            asyncio.create_task(_pump(index, *item))
+            for index, item in enumerate(prepared)
+        ]
+        remaining = len(tasks)
+        try:
+            while remaining:
+                index, chunk = await queue.get()
+                if chunk is None:
+                    remaining -= 1
+                    continue
+                yield index, chunk
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     async def _stream_direct(
         self,
         query: str,
@@ -437,37 +625,14 @@ VOICE OUTPUT GUIDELINES:
         try:
             client = self._get_client()
 
-            # System prompt with voice guidelines
-            system_prompt = """You are Clarvis, a helpful AI home assistant.
-You can help with email, calendar, weather, and other tasks through specialized agents.
-For greetings, thanks, and general questions, respond naturally and helpfully.
-
-VOICE OUTPUT GUIDELINES:
-- Keep responses concise (1-2 sentences)
-- Do NOT end with questions unless you need clarification to proceed
-- Do NOT offer follow-up options like "Would you like..." or "Let me know if..."
-- Use natural, conversational language appropriate for spoken output"""
-
-            messages = []
-            if context.turns:
-                recent = context.get_recent_context(n=2)
-                messages.append(
-                    {
-                        "role": "user",
-                        "content": f"Recent conversation:\n{recent}\n\nNew query: {query}",
-                    }
-                )
-            else:
-                messages.append({"role": "user", "content": query})
-
             # Use streaming API
-            with client.messages.stream(
+            async with client.messages.stream(
                 model=self._config.model,
                 max_tokens=500,
-                system=system_prompt,
-                messages=messages,
+                system=DIRECT_SYSTEM_PROMPT,
+                messages=self._build_direct_messages(query, context),
             ) as stream:
-                for text in stream.text_stream:
+                async for text in stream.text_stream:
                     yield text
 
         except Exception as e:
@@ -500,6 +665,8 @@ VOICE OUTPUT GUIDELINES:
             return
 
         logger.info(f"Streaming from agent: {agent_name}")
+        # Let the agent start its I/O while the announcement is spoken
+        agent.prefetch(query)
 
         # Yield routing announcement for immediate voice feedback
         announcement = ROUTING_ANNOUNCEMENTS.get(agent_name, "Let me check on that. ")
@@ -528,22 +695,7 @@ VOICE OUTPUT GUIDELINES:
         """
         logger.info("Using fallback streaming for unmatched query")
 
-        available_agents = self._registry.list_agents()
-
-        if available_agents:
-            agent_list = ", ".join(available_agents)
-            content = (
-                f"I'm not sure how to help with that specific request. "
-                f"I can assist with: {agent_list}. "
-                f"Could you rephrase your question or ask about one of these topics?"
-            )
-        else:
-            content = (
-                "I'm not sure how to help with that request. "
-                "Could you try rephrasing your question?"
-            )
-
-        yield content
+        yield self._fallback_content()
 
 
 def create_orchestrator(
@@ -1,11 +1,43 @@
 """Intent classification for fast code-based routing."""
 
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from typing import Optional
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _compile_keyword_regex(
+    keywords: tuple[str, ...],
+) -> tuple[re.Pattern[str], tuple[str, ...]]:
+    """Compile a keyword list into a single word-bounded alternation.
+
+    Longer keywords come first so that e.g. "emails" wins over "email".
+    Each keyword is its own capture group, so a match's ``lastindex``
+    identifies the keyword without case-normalizing the matched text.
+    Cached at module level since keyword lists are class constants.
+
+    Returns:
+        Tuple of (compiled pattern, keywords in group order).
+    """
+    ordered = tuple(sorted(keywords, key=len, reverse=True))
+    alternation = "|".join(f"({re.escape(keyword)})" for keyword in ordered)
+    return re.compile(rf"\b(?:{alternation})\b", re.IGNORECASE), ordered
+
+
+# Cheap tokenizer for the keyword pre-filter. Every keyword that can match on
+# word boundaries contributes all of its letter runs as tokens of the query.
+_TOKEN_PATTERN = re.compile(r"[a-z]+")
+
+# Per-agent keyword matcher, flattened at construction:
+# (agent name, keyword regex or None, keywords in group order,
+#  shortest keyword length, keywords in declaration order)
+_KeywordMatcher = tuple[
+    str, Optional[re.Pattern[str]], tuple[str, ...], int, tuple[str, ...]
+]
+
+
+@dataclass(slots=True)
 class ClassificationResult:
     """Result of intent classification."""
 
@@ -126,6 +158,9 @@ class IntentClassifier:
     PATTERN_SCORE_CAP = 0.6
     AMBIGUITY_MARGIN = 0.1
 
+    # Number of normalized queries whose classification is memoized
+    CLASSIFY_CACHE_SIZE = 1024
+
     def __init__(self, threshold: float = 0.7) -> None:
         """Initialize the classifier.
 
@@ -135,15 +170,74 @@ class IntentClassifier:
         """
         self.threshold = threshold
         self._compiled_patterns: dict[str, list[re.Pattern[str]]] = {}
+        self._pattern_sources: dict[str, tuple[str, ...]] = {}
+        self._keyword_matchers: tuple[_KeywordMatcher, ...] = ()
+        self._any_pattern: Optional[re.Pattern[str]] = None
+        self._keyword_tokens: frozenset[str] = frozenset()
         self._compile_patterns()
+        # Classification is a pure function of (normalized query, threshold)
+        self._classify_cached = lru_cache(maxsize=self.CLASSIFY_CACHE_SIZE)(
+            self._classify_uncached
+        )
 
     def _compile_patterns(self) -> None:
-        """Pre-compile regex patterns for performance."""
+        """Pre-compile regex patterns for performance.
+
+        Everything the per-query path needs is resolved here into flat
+        tuples, so matching does no lookups into AGENT_PATTERNS.
+        """
+        keyword_matchers: list[_KeywordMatcher] = []
         for agent_name, config in self.AGENT_PATTERNS.items():
+            keywords = tuple(config.get("keywords", []))
+            if keywords:
+                regex, ordered = _compile_keyword_regex(keywords)
+                keyword_matchers.append(
+                    (agent_name, regex, ordered, min(map(len, keywords)), keywords)
+                )
+            else:
+                keyword_matchers.append((agent_name, None, (), 0, ()))
+
+            patterns = tuple(config.get("patterns", []))
+            self._pattern_sources[agent_name] = patterns
             self._compiled_patterns[agent_name] = [
-                re.compile(pattern, re.IGNORECASE)
-                for pattern in config.get("patterns", [])
+                re.compile(pattern, re.IGNORECASE) for pattern in patterns
             ]
+        self._keyword_matchers = tuple(keyword_matchers)
+
+        # Every letter run of every keyword; a query sharing none of them
+        # cannot match any keyword regex
+        self._keyword_tokens = frozenset(
+            token
+            for config in self.AGENT_PATTERNS.values()
+            for keyword in config.get("keywords", [])
+            for token in _TOKEN_PATTERN.findall(keyword.lower())
+        )
+
+        # Union of every agent's patterns: a single scan tells us whether any
+        # pattern can match at all. It cannot replace the per-pattern scans,
+        # since overlapping matches are needed for scoring.
+        all_patterns = [
+            pattern
+            for config in self.AGENT_PATTERNS.values()
+            for pattern in config.get("patterns", [])
+        ]
+        if all_patterns:
+            self._any_pattern = re.compile(
+                "|".join(f"(?:{pattern})" for pattern in all_patterns), re.IGNORECASE
+            )
+
+    def _has_pattern_match(self, query: str) -> bool:
+        """Check in one scan whether any agent pattern matches the query."""
+        return self._any_pattern is not None and bool(self._any_pattern.search(query))
+
+    def _may_match_keywords(self, query: str) -> bool:
+        """Check with a set lookup whether any keyword could match the query.
+
+        Args:
+            query: The query, already lowercased as classify() does.
+        """
+        tokens = _TOKEN_PATTERN.findall(query)
+        return not self._keyword_tokens.isdisjoint(tokens)
 
     def _match_keywords(self, query: str) -> dict[str, tuple[float, list[str]]]:
         """Match keywords in the query.
@@ -155,15 +249,16 @@ class IntentClassifier:
             Dict mapping agent_name -> (score, matched_keywords).
             Score is capped at KEYWORD_SCORE_CAP.
         """
-        query_lower = query.lower()
         results: dict[str, tuple[float, list[str]]] = {}
-
-        for agent_name, config in self.AGENT_PATTERNS.items():
-            matched = []
-            for keyword in config.get("keywords", []):
-                # Use word boundary matching for keywords
-                if re.search(rf"\b{re.escape(keyword)}\b", query_lower):
-                    matched.append(keyword)
+        for agent_name, pattern, ordered, min_len, keywords in self._keyword_matchers:
+            matched: list[str] = []
+            # Queries shorter than the shortest keyword cannot match any
+            if pattern is not None and len(query) >= min_len:
+                # One case-insensitive pass over the query; each keyword
+                # counts once, reported in declaration order
+                found = {ordered[m.lastindex - 1] for m in pattern.finditer(query)}
+                if found:
+                    matched = [k for k in keywords if k in found]
 
             score = min(
                 len(matched) * self.KEYWORD_SCORE_PER_MATCH, self.KEYWORD_SCORE_CAP
@@ -175,6 +270,9 @@ class IntentClassifier:
     def _match_patterns(self, query: str) -> dict[str, tuple[float, list[str]]]:
         """Match regex patterns in the query.
 
+        Runs every agent's patterns. classify() calls this only once
+        _has_pattern_match() has found a match, so there is no gate here.
+
         Args:
             query: The user's query string.
 
@@ -182,22 +280,78 @@ class IntentClassifier:
             Dict mapping agent_name -> (score, matched_pattern_strings).
             Score is capped at PATTERN_SCORE_CAP.
         """
-        results: dict[str, tuple[float, list[str]]] = {}
+        return {
+            agent_name: self._match_patterns_for(agent_name, query)
+            for agent_name in self._compiled_patterns
+        }
 
-        for agent_name, patterns in self._compiled_patterns.items():
-            matched = []
-            for i, pattern in enumerate(patterns):
-                if pattern.search(query):
-                    # Store the original pattern string for debugging
-                    original_pattern = self.AGENT_PATTERNS[agent_name]["patterns"][i]
-                    matched.append(original_pattern)
+    def _match_patterns_for(
+        self, agent_name: str, query: str
+    ) -> tuple[float, list[str]]:
+        """Match a single agent's regex patterns in the query.
 
-            score = min(
-                len(matched) * self.PATTERN_SCORE_PER_MATCH, self.PATTERN_SCORE_CAP
+        Args:
+            agent_name: The agent whose patterns should be run.
+            query: The user's query string.
+
+        Returns:
+            Tuple of (score, matched_pattern_strings).
+            Score is capped at PATTERN_SCORE_CAP.
+        """
+        # Report the original pattern strings for debugging
+        matched = [
+            source
+            for pattern, source in zip(
+                self._compiled_patterns[agent_name], self._pattern_sources[agent_name]
             )
-            results[agent_name] = (score, matched)
+            if pattern.search(query)
+        ]
 
-        return results
+        score = min(len(matched) * self.PATTERN_SCORE_PER_MATCH, self.PATTERN_SCORE_CAP)
+        return (score, matched)
+
+    def _match_patterns_saturated(
+        self, query: str, keyword_results: dict[str, tuple[float, list[str]]]
+    ) -> Optional[dict[str, tuple[float, list[str]]]]:
+        """Run patterns for the keyword winner only, when that is conclusive.
+
+        When one agent saturates the keyword score and no other agent matched
+        any keyword, the others can score at most PATTERN_SCORE_CAP. If the
+        winner's combined score already clears that by AMBIGUITY_MARGIN, the
+        remaining pattern scans cannot change the outcome and are skipped.
+
+        Args:
+            query: The user's query string.
+            keyword_results: Output of _match_keywords for the query.
+
+        Returns:
+            Pattern results for the winning agent only, or None if a full
+            pattern scan is required.
+        """
+        if not keyword_results:
+            return None
+
+        best_agent = max(keyword_results, key=lambda name: keyword_results[name][0])
+        best_keyword_score = keyword_results[best_agent][0]
+        runner_up_score = max(
+            (
+                score
+                for name, (score, _) in keyword_results.items()
+                if name != best_agent
+            ),
+            default=0.0,
+        )
+        if best_keyword_score - runner_up_score < self.KEYWORD_SCORE_CAP:
+            return None
+        if best_agent not in self._compiled_patterns:
+            return None
+
+        best_patterns = self._match_patterns_for(best_agent, query)
+        best_score = min(best_keyword_score + best_patterns[0], 1.0)
+        if best_score - self.PATTERN_SCORE_CAP < self.AMBIGUITY_MARGIN:
+            return None
+
+        return {best_agent: best_patterns}
 
     def classify(self, query: str) -> ClassificationResult:
         """Classify a query and determine the target agent.
@@ -207,14 +361,52 @@ class IntentClassifier:
         2. Regex pattern matching: +0.3 per pattern (max 0.6)
         3. needs_llm_routing = True if confidence < threshold OR no clear winner
 
+        Results are memoized on the stripped, lowercased query since all
+        matching is case-insensitive.
+
         Args:
             query: The user's query string.
 
         Returns:
             ClassificationResult with the best matching agent and confidence.
         """
-        keyword_results = self._match_keywords(query)
-        pattern_results = self._match_patterns(query)
+        cached = self._classify_cached(query.strip().lower(), self.threshold)
+        # Hand out fresh lists so callers can't mutate the cached result
+        return replace(
+            cached,
+            matched_keywords=list(cached.matched_keywords),
+            matched_patterns=list(cached.matched_patterns),
+        )
+
+    def _classify_uncached(self, query: str, threshold: float) -> ClassificationResult:
+        """Run keyword and pattern matching for classify().
+
+        Args:
+            query: The normalized query string.
+            threshold: Confidence threshold for code-based routing.
+
+        Returns:
+            ClassificationResult with the best matching agent and confidence.
+        """
+        has_pattern_match = self._has_pattern_match(query)
+        may_match_keywords = self._may_match_keywords(query)
+        if not has_pattern_match and not may_match_keywords:
+            # Trivial queries ("ok", "yes") skip all per-agent regex work
+            return ClassificationResult(
+                agent_name=None,
+                confidence=0.0,
+                needs_llm_routing=True,
+            )
+
+        keyword_results = self._match_keywords(query) if may_match_keywords else {}
+        pattern_results: Optional[dict[str, tuple[float, list[str]]]]
+        if not has_pattern_match:
+            pattern_results = {}
+        else:
+            # Skip other agents' pattern scans when the keyword winner is decisive
+            pattern_results = self._match_patterns_saturated(query, keyword_results)
+            if pattern_results is None:
+                pattern_results = self._match_patterns(query)
 
         # Combine scores per agent
         agent_scores: dict[str, float] = {}
@@ -253,7 +445,7 @@ class IntentClassifier:
                 is_ambiguous = True
 
         # Determine if LLM routing is needed
-        needs_llm = best_score < self.threshold or is_ambiguous
+        needs_llm = best_score < threshold or is_ambiguous
 
         # When ambiguous, don't return any single agent's matches
         if is_ambiguous:
@@ -1,14 +1,48 @@
 """Configuration for the orchestrator."""
 
 import json
-from dataclasses import dataclass, field
+import threading
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Dict, Optional
-
-
-@dataclass
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+# orjson is an optional, faster JSON parser; the stdlib is used without it
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Top-level keys that mark a config file as using the nested format
+_NESTED_SECTIONS = ("orchestrator", "routing", "agents", "logging")
+
+# (section, key, field name) for scalar settings in the nested config format.
+# Missing keys fall back to the dataclass field defaults.
+_NESTED_FIELDS: tuple[tuple[str, str, str], ...] = (
+    ("orchestrator", "model", "model"),
+    ("orchestrator", "router_model", "router_model"),
+    ("orchestrator", "session_timeout_minutes", "session_timeout_minutes"),
+    ("orchestrator", "max_turns", "max_turns"),
+    ("routing", "code_routing_threshold", "code_routing_threshold"),
+    ("routing", "llm_routing_enabled", "llm_routing_enabled"),
+    ("routing", "follow_up_detection", "follow_up_detection"),
+    ("routing", "default_agent", "default_agent"),
+    ("logging", "level", "log_level"),
+    ("logging", "log_routing_decisions", "log_routing_decisions"),
+    ("logging", "log_agent_responses", "log_agent_responses"),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class OrchestratorConfig:
-    """Configuration for the orchestrator agent."""
+    """Configuration for the orchestrator agent.
+
+    Instances are immutable, including the agent mappings, so cached configs
+    can be shared safely; use dataclasses.replace() to derive a variant.
+    """
 
     # Orchestrator settings
     model: str = "claude-sonnet-4-20250514"
@@ -23,8 +57,12 @@ class OrchestratorConfig:
     default_agent: Optional[str] = None
 
     # Agent settings
-    enabled_agents: Dict[str, bool] = field(default_factory=lambda: {"gmail": True})
-    agent_priorities: Dict[str, int] = field(default_factory=lambda: {"gmail": 1})
+    enabled_agents: Mapping[str, bool] = field(
+        default_factory=lambda: MappingProxyType({"gmail": True})
+    )
+    agent_priorities: Mapping[str, int] = field(
+        default_factory=lambda: MappingProxyType({"gmail": 1})
+    )
 
     # Logging settings
     log_level: str = "INFO"
@@ -39,6 +77,9 @@ class OrchestratorConfig:
         Nested format has sections: orchestrator, routing, agents, logging.
         Flat format has all fields at the root level.
 
+        Parsed configs are cached per file and reused until the file's
+        modification time or size changes.
+
         Args:
             path: Path to the configuration file.
 
@@ -46,87 +87,90 @@ class OrchestratorConfig:
             OrchestratorConfig instance with values from file,
             falling back to defaults for missing fields.
         """
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except OSError:
             return cls()
 
+        cache_key = str(path.resolve())
+        with _CONFIG_CACHE_LOCK:
+            cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+        config = cls._parse_file(path)
+        with _CONFIG_CACHE_LOCK:
+            _CONFIG_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, config)
+        return config
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget all configs cached by from_file (useful for testing)."""
+        with _CONFIG_CACHE_LOCK:
+            _CONFIG_CACHE.clear()
+
+    @classmethod
+    def _parse_file(cls, path: Path) -> "OrchestratorConfig":
+        """Read and parse a configuration file, bypassing the cache."""
         try:
-            with open(path) as f:
-                data = json.load(f)
+            data = _load_json(path)
         except (json.JSONDecodeError, OSError):
             # Return defaults if config file is corrupted or unreadable
             return cls()
 
-        # Detect nested vs flat structure
-        is_nested = any(
-            key in data for key in ("orchestrator", "routing", "agents", "logging")
-        )
-
-        if is_nested:
-            return cls._from_nested(data)
-        else:
-            return cls._from_flat(data)
+        return cls._from_dict(data)
 
     @classmethod
-    def _from_flat(cls, data: dict) -> "OrchestratorConfig":
-        """Parse flat (legacy) config format."""
-        return cls(
-            model=data.get("model", "claude-sonnet-4-20250514"),
-            router_model=data.get("router_model", "claude-3-5-haiku-20241022"),
-            session_timeout_minutes=data.get("session_timeout_minutes", 30),
-            max_turns=data.get("max_turns", 5),
-            code_routing_threshold=data.get("code_routing_threshold", 0.7),
-            llm_routing_enabled=data.get("llm_routing_enabled", True),
-            follow_up_detection=data.get("follow_up_detection", True),
-            default_agent=data.get("default_agent"),
-            enabled_agents=data.get("enabled_agents", {"gmail": True}),
-            agent_priorities=data.get("agent_priorities", {"gmail": 1}),
-            log_level=data.get("log_level", "INFO"),
-            log_routing_decisions=data.get("log_routing_decisions", True),
-            log_agent_responses=data.get("log_agent_responses", True),
-        )
+    def _from_dict(cls, data: dict) -> "OrchestratorConfig":
+        """Build a config from parsed JSON in either format.
 
-    @classmethod
-    def _from_nested(cls, data: dict) -> "OrchestratorConfig":
-        """Parse nested config format with orchestrator/routing/agents/logging sections."""
-        orch = data.get("orchestrator", {})
-        routing = data.get("routing", {})
-        agents_section = data.get("agents", {})
-        logging_section = data.get("logging", {})
-
-        # Parse agents section into enabled_agents and agent_priorities
-        enabled_agents: Dict[str, bool] = {}
-        agent_priorities: Dict[str, int] = {}
-
-        for agent_name, agent_config in agents_section.items():
-            if isinstance(agent_config, dict):
-                enabled_agents[agent_name] = agent_config.get("enabled", False)
-                agent_priorities[agent_name] = agent_config.get("priority", 99)
-
-        # Use defaults if no agents configured
-        if not enabled_agents:
-            enabled_agents = {"gmail": True}
-        if not agent_priorities:
-            agent_priorities = {"gmail": 1}
-
-        return cls(
-            # Orchestrator settings
-            model=orch.get("model", "claude-sonnet-4-20250514"),
-            router_model=orch.get("router_model", "claude-3-5-haiku-20241022"),
-            session_timeout_minutes=orch.get("session_timeout_minutes", 30),
-            max_turns=orch.get("max_turns", 5),
-            # Routing settings
-            code_routing_threshold=routing.get("code_routing_threshold", 0.7),
-            llm_routing_enabled=routing.get("llm_routing_enabled", True),
-            follow_up_detection=routing.get("follow_up_detection", True),
-            default_agent=routing.get("default_agent"),
-            # Agent settings
-            enabled_agents=enabled_agents,
-            agent_priorities=agent_priorities,
-            # Logging settings
-            log_level=logging_section.get("level", "INFO"),
-            log_routing_decisions=logging_section.get("log_routing_decisions", True),
-            log_agent_responses=logging_section.get("log_agent_responses", True),
-        )
+        Only settings present in the data are passed on, so everything else
+        keeps its field default. Unknown keys are ignored.
+        """
+        if any(section in data for section in _NESTED_SECTIONS):
+            locations = [
+                (data.get(section, {}), key, field_name)
+                for section, key, field_name in _NESTED_FIELDS
+            ]
+        else:
+            # Flat (legacy) keys map one-to-one onto fields
+            locations = [(data, f.name, f.name) for f in fields(cls)]
+
+        overrides = {
+            field_name: source[key]
+            for source, key, field_name in locations
+            if key in source
+        }
+
+        # Parse agents section into enabled_agents and agent_priorities.
+        # Flat files have no "agents" key, so this is a no-op for them.
+        agents = {
+            name: agent_config
+            for name, agent_config in data.get("agents", {}).items()
+            if isinstance(agent_config, dict)
+        }
+
+        # Field defaults apply if no agents are configured
+        if agents:
+            overrides["enabled_agents"] = MappingProxyType(
+                {
+                    name: agent_config.get("enabled", False)
+                    for name, agent_config in agents.items()
+                }
+            )
+            overrides["agent_priorities"] = MappingProxyType(
+                {
+                    name: agent_config.get("priority", 99)
+                    for name, agent_config in agents.items()
+                }
+            )
+
+        # Flat files may carry the agent mappings directly
+        for name in ("enabled_agents", "agent_priorities"):
+            if isinstance(overrides.get(name), dict):
+                overrides[name] = MappingProxyType(dict(overrides[name]))
+
+        return cls(**overrides)
 
     @classmethod
     def default_config_path(cls) -> Path:
@@ -136,6 +180,29 @@ class OrchestratorConfig:
         )
 
 
+def _load_json(path: Path) -> Any:
+    """Read and decode a JSON file, using orjson when it is installed.
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON (orjson's
+            decode error subclasses it).
+        OSError: If the file cannot be read.
+    """
+    raw = path.read_bytes()
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Resolved path -> (st_mtime_ns, st_size, parsed config), filled by from_file
+_CONFIG_CACHE: dict[str, tuple[int, int, OrchestratorConfig]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
 def load_config() -> OrchestratorConfig:
-    """Load the orchestrator configuration from the default path."""
+    """Load the orchestrator configuration from the default path.
+
+    The parsed file is cached by from_file and re-read only when it changes.
+    Call OrchestratorConfig.clear_cache() to force a re-read (e.g. in tests).
+    """
     return OrchestratorConfig.from_file(OrchestratorConfig.default_config_path())
@@ -1,5 +1,7 @@
 """System prompts for the orchestrator router."""
 
+import io
+import re
 from typing import Any
 
 ROUTER_SYSTEM_PROMPT = """You are a routing assistant for a multi-agent home automation system.
@@ -10,7 +12,7 @@ AVAILABLE AGENTS:
 
 ROUTING RULES:
 1. Route to an agent ONLY if the query clearly matches their capabilities
-2. Set AGENT: DIRECT for:
+2. Set "agent" to "DIRECT" for:
    - Greetings ("hello", "hi", "hey", "good morning")
    - Thanks ("thank you", "thanks")
    - Simple questions about yourself or the system
@@ -19,18 +21,31 @@ ROUTING RULES:
 4. Consider conversation context when routing follow-ups
 
 RESPONSE FORMAT:
-You MUST respond in this exact format (one item per line):
-AGENT: <agent_name or DIRECT>
-CONFIDENCE: <0.0 to 1.0>
-REASONING: <brief one-line explanation>
+You MUST respond with a single JSON object and nothing else:
+{{"agent": "<agent_name or DIRECT>", "confidence": <0.0 to 1.0>, "reasoning": "<brief one-line explanation>"}}
 
 Examples:
-- For "check my emails": AGENT: gmail
-- For "hello there": AGENT: DIRECT
-- For "what's on my calendar": AGENT: calendar
+- For "check my emails": {{"agent": "gmail", "confidence": 0.9, "reasoning": "..."}}
+- For "hello there": {{"agent": "DIRECT", "confidence": 0.9, "reasoning": "..."}}
+- For "what's on my calendar": {{"agent": "calendar", "confidence": 0.9, "reasoning": "..."}}
 """
 
-GREETING_PATTERNS = [
+DIRECT_SYSTEM_PROMPT = """You are Clarvis, a helpful AI home assistant.
+You can help with email, calendar, weather, and other tasks through specialized agents.
+For greetings, thanks, and general questions, respond naturally and helpfully.
+
+VOICE OUTPUT GUIDELINES:
+- Keep responses concise (1-2 sentences)
+- Do NOT end with questions unless you need clarification to proceed
+- Do NOT offer follow-up options like "Would you like..." or "Let me know if..."
+- Use natural, conversational language appropriate for spoken output"""
+
+# Wraps a new query with recent turns: format(recent=..., query=...)
+RECENT_CONTEXT_TEMPLATE = "Recent conversation:\n{recent}\n\nNew query: {query}"
+
+# Direct-handling phrases. Kept lowercase: matching is case-insensitive and
+# routing reasons report the phrase in lowercase.
+GREETING_PATTERNS = (
     "hello",
     "hi",
     "hey",
@@ -41,9 +56,9 @@ GREETING_PATTERNS = [
     "greetings",
     "yo",
     "hiya",
-]
+)
 
-THANKS_PATTERNS = [
+THANKS_PATTERNS = (
     "thank you",
     "thanks",
     "thx",
@@ -51,7 +66,25 @@ THANKS_PATTERNS = [
     "cheers",
     "thank u",
     "ty",
-]
+)
+
+# Greetings and thanks fused into one regex, so detecting either is a single
+# scan. Greetings must open the query; thanks may appear anywhere. Both match
+# whole words only, so "your" is not "yo" and "city" is not "ty". A greeting
+# can only match at the start, where it is tried first, so it takes priority.
+# match.lastgroup names the kind of phrase found.
+DIRECT_INTENT_REGEX = re.compile(
+    r"^\s*(?P<greeting>"
+    + "|".join(map(re.escape, GREETING_PATTERNS))
+    + r")\b|\b(?P<thanks>"
+    + "|".join(map(re.escape, THANKS_PATTERNS))
+    + r")\b",
+    re.IGNORECASE,
+)
+
+
+# Agent description used when no agents are registered
+NO_AGENTS_DESCRIPTION = "No agents currently available."
 
 
 def format_agent_descriptions(registry_capabilities: dict[str, list[Any]]) -> str:
@@ -65,23 +98,23 @@ def format_agent_descriptions(registry_capabilities: dict[str, list[Any]]) -> st
         Formatted string describing each agent and its capabilities.
     """
     if not registry_capabilities:
-        return "No agents currently available."
+        return NO_AGENTS_DESCRIPTION
 
-    lines = []
-    for agent_name, capabilities in registry_capabilities.items():
-        lines.append(f"Agent: {agent_name}")
+    buf = io.StringIO()
+    for index, (agent_name, capabilities) in enumerate(registry_capabilities.items()):
+        if index:
+            buf.write("\n")  # Blank line between agents
+        buf.write(f"Agent: {agent_name}\n")
 
         if capabilities:
             for cap in capabilities:
-                lines.append(f"  - {cap.name}: {cap.description}")
+                buf.write(f"  - {cap.name}: {cap.description}\n")
 
             # Include first 2 examples from the first capability
             if capabilities[0].examples:
-                examples = capabilities[0].examples[:2]
-                lines.append(f"  Example queries: {', '.join(examples)}")
+                examples = ", ".join(capabilities[0].examples[:2])
+                buf.write(f"  Example queries: {examples}\n")
         else:
-            lines.append("  - (No capabilities defined)")
-
-        lines.append("")  # Blank line between agents
+            buf.write("  - (No capabilities defined)\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
@@ -1,23 +1,107 @@
 """Hybrid router combining code-based and LLM routing for the orchestrator."""
 
+import json
 import os
+import re
 from dataclasses import dataclass
-from typing import Optional
-
-from anthropic import Anthropic
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
 from ..core import AgentRegistry, ConversationContext
 from .classifier import ClassificationResult, IntentClassifier
 from .config import OrchestratorConfig
 from .prompts import (
-    GREETING_PATTERNS,
+    DIRECT_INTENT_REGEX,
+    RECENT_CONTEXT_TEMPLATE,
     ROUTER_SYSTEM_PROMPT,
-    THANKS_PATTERNS,
     format_agent_descriptions,
 )
 
+if TYPE_CHECKING:
+    # Imported lazily in the client property; code-based routing never needs it
+    from anthropic import Anthropic
+
+# One "KEY: value" line of the LLM routing response. Horizontal whitespace
+# only ([^\S\n]), so an empty value never swallows the next line.
+_LLM_FIELD_RE = re.compile(
+    r"^[^\S\n]*(AGENT|CONFIDENCE|REASONING)[^\S\n]*:[^\S\n]*(.*?)[^\S\n]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# One "key": value pair of a JSON routing response. A string value may be
+# unterminated, so fields survive a reply cut off at max_tokens.
+_JSON_FIELD_RE = re.compile(
+    r'"(agent|confidence|reasoning)"\s*:\s*(?:"((?:[^"\\]|\\.)*)"?|(-?[\d.]+))',
+    re.IGNORECASE,
+)
+
+
+def _extract_llm_fields(response_text: str) -> dict[str, object]:
+    """Pull the routing fields out of an LLM reply.
+
+    Takes the outermost {...} span, so code fences and text around the JSON
+    object are ignored. Replies that don't decode fall back to scanning for
+    JSON "key": value pairs (truncated JSON), then for KEY: value lines.
+
+    Args:
+        response_text: Raw text response from LLM.
+
+    Returns:
+        Field values keyed by lowercase field name; missing fields are absent.
+    """
+    start = response_text.find("{")
+    end = response_text.rfind("}")
+    if start != -1 and end > start:
+        try:
+            data = json.loads(response_text[start : end + 1])
+        except json.JSONDecodeError:
+            data = None
+        if isinstance(data, dict):
+            return {key.lower(): value for key, value in data.items()}
+
+    fields: dict[str, object] = {}
+    for match in _JSON_FIELD_RE.finditer(response_text):
+        string_value, number_value = match.group(2), match.group(3)
+        if string_value is None:
+            fields[match.group(1).lower()] = number_value
+            continue
+        try:
+            fields[match.group(1).lower()] = json.loads(f'"{string_value}"')
+        except json.JSONDecodeError:  # Cut off mid-escape
+            fields[match.group(1).lower()] = string_value
+    if fields:
+        return fields
+
+    for match in _LLM_FIELD_RE.finditer(response_text):
+        fields[match.group(1).lower()] = match.group(2)
+    return fields
+
+
+# Fixed routing reasons, shared by every decision that uses them
+_REASON_CODE_ROUTING = "Code-based routing"
+_REASON_LLM_DISABLED = "LLM disabled, using low-confidence code match"
+_REASON_NO_MATCH = "No agent match found, handling directly"
+_REASON_UNKNOWN_AGENT = "LLM suggested unknown agent, handling directly"
+
 
-@dataclass
+@lru_cache(maxsize=4)
+def _get_anthropic_client(api_key: str) -> "Anthropic":
+    """Get the Anthropic client shared by all routers using an API key.
+
+    Sharing one client means sharing its HTTP connection pool.
+
+    Args:
+        api_key: Anthropic API key.
+
+    Returns:
+        Anthropic client instance.
+    """
+    from anthropic import Anthropic
+
+    return Anthropic(api_key=api_key)
+
+
+@dataclass(slots=True)
 class RoutingDecision:
     """Result of the routing decision.
 
@@ -39,8 +123,8 @@ class IntentRouter:
     """Hybrid router combining code-based and LLM routing.
 
     Routing algorithm:
-    1. Check for follow-up (context.should_continue_with_agent)
-    2. Check for direct handling (greetings, thanks)
+    1. Check for direct handling (greetings, thanks)
+    2. Check for follow-up (context.should_continue_with_agent)
     3. Code-based fast path (classifier.classify)
     4. LLM routing if needs_llm_routing=True
     """
@@ -50,7 +134,7 @@ class IntentRouter:
         registry: AgentRegistry,
         config: OrchestratorConfig,
         classifier: Optional[IntentClassifier] = None,
-        anthropic_client: Optional[Anthropic] = None,
+        anthropic_client: Optional["Anthropic"] = None,
     ) -> None:
         """Initialize the router.
 
@@ -68,9 +152,17 @@ class IntentRouter:
             threshold=config.code_routing_threshold
         )
         self._client = anthropic_client
+        # Routing flags read on every route(); the config is immutable
+        self._follow_up_enabled = config.follow_up_detection
+        self._llm_routing_enabled = config.llm_routing_enabled
+        # Detailed reasons are only worth formatting if decisions are logged
+        self._detailed_reasoning = config.log_routing_decisions
+        # (registry version, formatted router system prompt)
+        self._system_prompt_cache: Optional[tuple[int, str]] = None
+        self._agent_names_cache: Optional[tuple[int, frozenset[str]]] = None
 
     @property
-    def client(self) -> Anthropic:
+    def client(self) -> "Anthropic":
         """Lazy-load Anthropic client.
 
         Raises:
@@ -80,7 +172,7 @@ class IntentRouter:
             api_key = os.environ.get("ANTHROPIC_API_KEY")
             if not api_key:
                 raise ValueError("ANTHROPIC_API_KEY environment variable not set")
-            self._client = Anthropic(api_key=api_key)
+            self._client = _get_anthropic_client(api_key)
         return self._client
 
     def _should_handle_directly(self, query: str) -> Optional[RoutingDecision]:
@@ -92,29 +184,23 @@ class IntentRouter:
         Returns:
             RoutingDecision if should handle directly, None otherwise.
         """
-        query_lower = query.lower().strip()
-
-        # Check greetings
-        for pattern in GREETING_PATTERNS:
-            if query_lower.startswith(pattern) or query_lower == pattern:
-                return RoutingDecision(
-                    agent_name=None,
-                    confidence=1.0,
-                    reasoning=f"Greeting detected: '{pattern}'",
-                    handle_directly=True,
-                )
-
-        # Check thanks
-        for pattern in THANKS_PATTERNS:
-            if pattern in query_lower:
-                return RoutingDecision(
-                    agent_name=None,
-                    confidence=1.0,
-                    reasoning=f"Thanks/acknowledgment detected: '{pattern}'",
-                    handle_directly=True,
-                )
-
-        return None
+        # One scan finds either a leading greeting or thanks anywhere
+        match = DIRECT_INTENT_REGEX.search(query)
+        if match is None:
+            return None
+
+        phrase = match.group(match.lastgroup).lower()
+        if match.lastgroup == "greeting":
+            reasoning = f"Greeting detected: '{phrase}'"
+        else:
+            reasoning = f"Thanks/acknowledgment detected: '{phrase}'"
+
+        return RoutingDecision(
+            agent_name=None,
+            confidence=1.0,
+            reasoning=reasoning,
+            handle_directly=True,
+        )
 
     def _check_follow_up(
         self, query: str, context: Optional[ConversationContext]
@@ -128,10 +214,7 @@ class IntentRouter:
         Returns:
             RoutingDecision if follow-up detected, None otherwise.
         """
-        if not self.config.follow_up_detection:
-            return None
-
-        if context is None:
+        if not self._follow_up_enabled or context is None:
             return None
 
         follow_up_agent = context.should_continue_with_agent(query)
@@ -139,7 +222,7 @@ class IntentRouter:
             return None
 
         # Verify agent still exists in registry
-        if self.registry.get(follow_up_agent) is None:
+        if follow_up_agent not in self._agent_names():
             return None
 
         return RoutingDecision(
@@ -165,19 +248,13 @@ class IntentRouter:
         Returns:
             RoutingDecision from LLM analysis.
         """
-        # Build prompt with agent descriptions
-        capabilities = self.registry.get_all_capabilities()
-        agent_descriptions = format_agent_descriptions(capabilities)
-
-        system_prompt = ROUTER_SYSTEM_PROMPT.format(
-            agent_descriptions=agent_descriptions
-        )
+        system_prompt = self._system_prompt()
 
         # Build user message
         user_message = f"Query: {query}"
         if context and context.turns:
             recent = context.get_recent_context(n=2)
-            user_message = f"Recent conversation:\n{recent}\n\nNew query: {query}"
+            user_message = RECENT_CONTEXT_TEMPLATE.format(recent=recent, query=query)
 
         # Add classification hints
         if classification.agent_name:
@@ -203,10 +280,49 @@ class IntentRouter:
             # Fallback: use code classification or handle directly
             return self._handle_llm_error(classification, str(e))
 
+    def _system_prompt(self) -> str:
+        """Build the router system prompt describing the registered agents.
+
+        Cached until the registry version changes.
+
+        Returns:
+            Formatted ROUTER_SYSTEM_PROMPT.
+        """
+        version = self.registry.version
+        cached = self._system_prompt_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        capabilities = self.registry.get_all_capabilities()
+        system_prompt = ROUTER_SYSTEM_PROMPT.format(
+            agent_descriptions=format_agent_descriptions(capabilities)
+        )
+        self._system_prompt_cache = (version, system_prompt)
+        return system_prompt
+
+    def _agent_names(self) -> frozenset[str]:
+        """Get the names of the registered agents.
+
+        Cached until the registry version changes.
+
+        Returns:
+            Frozenset of registered agent names.
+        """
+        version = self.registry.version
+        cached = self._agent_names_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        agent_names = frozenset(self.registry.list_agents())
+        self._agent_names_cache = (version, agent_names)
+        return agent_names
+
     def _parse_llm_response(self, response_text: str) -> RoutingDecision:
         """Parse the LLM response into a RoutingDecision.
 
-        Expected format:
+        Expected format is the JSON object requested by ROUTER_SYSTEM_PROMPT,
+        possibly fenced, wrapped in other text, or truncated. Replies without
+        JSON fall back to the line format:
         AGENT: <agent_name or DIRECT>
         CONFIDENCE: <0.0 to 1.0>
         REASONING: <explanation>
@@ -217,37 +333,34 @@ class IntentRouter:
         Returns:
             Parsed RoutingDecision.
         """
-        lines = response_text.strip().split("\n")
-
         agent_name: Optional[str] = None
         confidence: float = 0.5
         reasoning: str = "LLM routing"
         handle_directly: bool = False
 
-        for line in lines:
-            line = line.strip()
-            if line.upper().startswith("AGENT:"):
-                agent_value = line[6:].strip()
-                if agent_value.upper() == "DIRECT":
-                    handle_directly = True
-                    agent_name = None
-                else:
-                    agent_name = agent_value.lower()
-            elif line.upper().startswith("CONFIDENCE:"):
-                try:
-                    confidence = float(line[11:].strip())
-                    confidence = max(0.0, min(1.0, confidence))  # Clamp
-                except ValueError:
-                    confidence = 0.5
-            elif line.upper().startswith("REASONING:"):
-                reasoning = line[10:].strip()
+        fields = _extract_llm_fields(response_text)
+
+        agent_value = str(fields.get("agent") or "").strip()
+        if agent_value.upper() == "DIRECT":
+            handle_directly = True
+        elif agent_value:
+            agent_name = agent_value.lower()
+
+        if "confidence" in fields:
+            try:
+                confidence = max(0.0, min(1.0, float(fields["confidence"])))  # Clamp
+            except (TypeError, ValueError):
+                confidence = 0.5
+
+        if "reasoning" in fields:
+            reasoning = str(fields["reasoning"])
 
         # Validate agent exists
-        if agent_name and self.registry.get(agent_name) is None:
+        if agent_name and agent_name not in self._agent_names():
             # Agent doesn't exist, handle directly
             handle_directly = True
             agent_name = None
-            reasoning = "LLM suggested unknown agent, handling directly"
+            reasoning = _REASON_UNKNOWN_AGENT
 
         return RoutingDecision(
             agent_name=agent_name,
@@ -293,8 +406,8 @@ class IntentRouter:
         """Route a query to the appropriate agent.
 
         Routing algorithm:
-        1. Check for follow-up (context.should_continue_with_agent)
-        2. Check for direct handling (greetings, thanks)
+        1. Check for direct handling (greetings, thanks)
+        2. Check for follow-up (context.should_continue_with_agent)
         3. Code-based fast path (classifier.classify)
         4. LLM routing if needs_llm_routing=True
 
@@ -305,30 +418,35 @@ class IntentRouter:
         Returns:
             RoutingDecision indicating where to route.
         """
-        # Step 1: Check for follow-up
-        follow_up = self._check_follow_up(query, context)
-        if follow_up is not None:
-            return follow_up
-
-        # Step 2: Check for direct handling
+        # Step 1: Check for direct handling. Cheapest check and the most
+        # common queries, and a "thanks" should never go back to an agent.
         direct = self._should_handle_directly(query)
         if direct is not None:
             return direct
 
-        # Step 3: Code-based classification
+        # Step 2: Check for follow-up
+        follow_up = self._check_follow_up(query, context)
+        if follow_up is not None:
+            return follow_up
+
+        # Step 3: Code-based classification. IntentClassifier memoizes results
+        # per normalized query, so repeated queries skip the keyword scan.
         classification = self.classifier.classify(query)
 
         # If high confidence and LLM not needed, return immediately
         if not classification.needs_llm_routing:
+            reasoning = _REASON_CODE_ROUTING
+            if self._detailed_reasoning:
+                reasoning += f": matched keywords {classification.matched_keywords}"
             return RoutingDecision(
                 agent_name=classification.agent_name,
                 confidence=classification.confidence,
-                reasoning=f"Code-based routing: matched keywords {classification.matched_keywords}",
+                reasoning=reasoning,
                 handle_directly=False,
             )
 
         # Step 4: LLM routing for ambiguous cases
-        if self.config.llm_routing_enabled:
+        if self._llm_routing_enabled:
             return await self._llm_route(query, classification, context)
 
         # LLM disabled but routing needed - use best-effort code classification
@@ -336,7 +454,7 @@ class IntentRouter:
             return RoutingDecision(
                 agent_name=classification.agent_name,
                 confidence=classification.confidence,
-                reasoning="LLM disabled, using low-confidence code match",
+                reasoning=_REASON_LLM_DISABLED,
                 handle_directly=False,
             )
 
@@ -344,6 +462,6 @@ class IntentRouter:
         return RoutingDecision(
             agent_name=None,
             confidence=0.0,
-            reasoning="No agent match found, handling directly",
+            reasoning=_REASON_NO_MATCH,
             handle_directly=True,
         )
@@ -3,6 +3,7 @@
 from .agent import SkiAgent, create_ski_agent
 from .config import CachedConditions, RateLimiter, SkiAgentConfig
 from .tools import (
+    close_http_client,
     fetch_ski_conditions_impl,
     set_conditions_url,
     ski_tools_server,
@@ -18,6 +19,7 @@ __all__ = [
     "ski_tools_server",
     "fetch_ski_conditions_impl",
     "set_conditions_url",
+    "close_http_client",
 ]
 
 __version__ = "1.1.0"
@@ -10,15 +10,44 @@ from anthropic import Anthropic
 
 from ..core import AgentCapability, AgentResponse, BaseAgent
 from ..core.context import ConversationContext
-from .config import CachedConditions, RateLimiter, SkiAgentConfig
+from ..core.event_loop import run_coroutine
+from .config import DEFAULT_CONFIG, CachedConditions, RateLimiter, SkiAgentConfig
 from .prompts import SYSTEM_PROMPT
-from .tools import fetch_ski_conditions_impl
+from .tools import STALE_PREFIX, fetch_ski_conditions_impl
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# Setup logging. Levels and console output are left to the application
+# (see the __main__ block).
 logger = logging.getLogger(__name__)
 
 
+_CAPABILITIES: tuple[AgentCapability, ...] = (
+    AgentCapability(
+        name="snow_conditions",
+        description="Report snow depths and recent snowfall",
+        keywords=["snow", "powder", "depth", "base", "inches"],
+        examples=["How much snow at Meadows?", "What's the base depth?"],
+    ),
+    AgentCapability(
+        name="lift_status",
+        description="Report which lifts are open or on hold",
+        keywords=["lift", "lifts", "open", "running", "closed"],
+        examples=["Are the lifts running?", "Which lifts are open?"],
+    ),
+    AgentCapability(
+        name="weather",
+        description="Report mountain weather conditions",
+        keywords=["weather", "temperature", "wind", "visibility"],
+        examples=["What's the weather at Meadows?", "How cold is it?"],
+    ),
+    AgentCapability(
+        name="full_report",
+        description="Comprehensive ski conditions report",
+        keywords=["report", "conditions", "ski report"],
+        examples=["What's the ski report?", "Give me the full conditions"],
+    ),
+)
+
+
 class SkiAgent(BaseAgent):
     """Ski conditions reporter agent for Mt Hood Meadows."""
 
@@ -29,13 +58,15 @@ class SkiAgent(BaseAgent):
             config: Configuration for the agent. If None, uses default config.
             client: Optional Anthropic client. If None, creates one.
         """
-        self.config = config or SkiAgentConfig()
+        self.config = config or DEFAULT_CONFIG
         self._setup_logging()
         self.rate_limiter = RateLimiter(
             max_calls=self.config.max_requests_per_minute,
             time_window=timedelta(minutes=1),
         )
         self._cache: Optional[CachedConditions] = None
+        # Fetch in progress, shared by concurrent cache misses and refreshes
+        self._inflight: Optional[asyncio.Task[str]] = None
 
         # Validate API key exists
         api_key = os.environ.get("ANTHROPIC_API_KEY")
@@ -58,32 +89,7 @@ class SkiAgent(BaseAgent):
     @property
     def capabilities(self) -> list[AgentCapability]:
         """List of capabilities this agent provides."""
-        return [
-            AgentCapability(
-                name="snow_conditions",
-                description="Report snow depths and recent snowfall",
-                keywords=["snow", "powder", "depth", "base", "inches"],
-                examples=["How much snow at Meadows?", "What's the base depth?"],
-            ),
-            AgentCapability(
-                name="lift_status",
-                description="Report which lifts are open or on hold",
-                keywords=["lift", "lifts", "open", "running", "closed"],
-                examples=["Are the lifts running?", "Which lifts are open?"],
-            ),
-            AgentCapability(
-                name="weather",
-                description="Report mountain weather conditions",
-                keywords=["weather", "temperature", "wind", "visibility"],
-                examples=["What's the weather at Meadows?", "How cold is it?"],
-            ),
-            AgentCapability(
-                name="full_report",
-                description="Comprehensive ski conditions report",
-                keywords=["report", "conditions", "ski report"],
-                examples=["What's the ski report?", "Give me the full conditions"],
-            ),
-        ]
+        return list(_CAPABILITIES)
 
     async def process(
         self, query_text: str, context: Optional[ConversationContext] = None
@@ -109,6 +115,23 @@ class SkiAgent(BaseAgent):
         """Check if the agent is operational."""
         return True
 
+    def prefetch(self, query_text: str) -> None:
+        """Start refreshing the conditions cache in the background.
+
+        Does nothing if the cache is fresh, a fetch is already running, or
+        there is no running event loop to run the fetch on.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        cache = self._cache
+        if cache and not cache.is_expired(self.config.cache_ttl_minutes):
+            return
+        if self._inflight is None:
+            self._inflight = asyncio.create_task(self._refresh_conditions())
+
     async def stream(
         self, query_text: str, context: Optional[ConversationContext] = None
     ) -> AsyncGenerator[str, None]:
@@ -132,7 +155,7 @@ class SkiAgent(BaseAgent):
 
         try:
             # Pre-fetch ski conditions
-            conditions_data = await fetch_ski_conditions_impl()
+            conditions_data = await self._get_cached_conditions()
 
             # Build prompt with conditions data
             prompt = self._build_prompt_with_data(query_text, conditions_data)
@@ -160,6 +183,19 @@ class SkiAgent(BaseAgent):
         self.config.log_dir.mkdir(parents=True, exist_ok=True)
 
         log_file = self.config.log_dir / f"access_{datetime.now():%Y%m%d}.log"
+        # Agents can be created many times per process; keep one handler per
+        # log directory, moving it to today's file once the date has changed.
+        # A long-lived agent still writes to the file of the day it was made.
+        log_path = os.path.abspath(log_file)
+        for handler in list(logger.handlers):
+            if isinstance(handler, logging.FileHandler) and os.path.dirname(
+                handler.baseFilename
+            ) == os.path.dirname(log_path):
+                if handler.baseFilename == log_path:
+                    return
+                logger.removeHandler(handler)
+                handler.close()
+
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(
             logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
@@ -167,24 +203,80 @@ class SkiAgent(BaseAgent):
         logger.addHandler(file_handler)
         logger.info("Ski Agent logging initialized")
 
-    def _build_prompt_with_data(self, user_query: str, conditions_data: str) -> str:
-        """Build prompt with pre-fetched conditions data.
+    def _build_prompt_with_data(
+        self, user_query: str, conditions_data: str
+    ) -> list[dict]:
+        """Build the user message content with pre-fetched conditions data.
+
+        The conditions block is marked for prompt caching. Queries within a
+        cache refresh share the same system prompt and conditions, so only
+        the question is processed anew.
 
         Args:
             user_query: The user's original query
             conditions_data: Raw conditions data from the ski conditions page
 
         Returns:
-            Prompt string with conditions data included
+            Content blocks for the user message
+        """
+        return [
+            {
+                "type": "text",
+                "text": (
+                    "Here are the current ski conditions from Mt Hood Meadows:\n\n"
+                    f"<conditions>\n{conditions_data}\n</conditions>"
+                ),
+                "cache_control": {"type": "ephemeral"},
+            },
+            {
+                "type": "text",
+                "text": (
+                    "Based on this data, please answer the following question:\n"
+                    f"{user_query}"
+                ),
+            },
+        ]
+
+    async def _get_cached_conditions(self) -> str:
+        """Get ski conditions data, fetching only when the cache has expired.
+
+        Data up to twice the TTL old is returned immediately while a refresh
+        runs in the background. Concurrent cache misses share a single fetch
+        rather than each requesting the page.
+
+        Returns:
+            Raw conditions data from the ski conditions page
         """
-        return f"""Here are the current ski conditions from Mt Hood Meadows:
+        ttl_minutes = self.config.cache_ttl_minutes
+        cache = self._cache
+        if cache and not cache.is_expired(ttl_minutes):
+            return cache.data
+
+        if self._inflight is None:
+            self._inflight = asyncio.create_task(self._refresh_conditions())
 
-<conditions>
-{conditions_data}
-</conditions>
+        if cache and not cache.is_expired(2 * ttl_minutes):
+            return cache.data
 
-Based on this data, please answer the following question:
-{user_query}"""
+        # Shielded so a cancelled waiter doesn't cancel the shared fetch
+        return await asyncio.shield(self._inflight)
+
+    async def _refresh_conditions(self) -> str:
+        """Fetch ski conditions and cache them if the fetch succeeded.
+
+        Returns:
+            Raw conditions data, or the fetch's error message
+        """
+        try:
+            data = await fetch_ski_conditions_impl()
+        finally:
+            self._inflight = None
+
+        # Failures come back as "Error: ..." or stale-marked text; don't keep
+        # those as fresh
+        if not data.startswith(("Error:", STALE_PREFIX)):
+            self._cache = CachedConditions(data=data, timestamp=datetime.now())
+        return data
 
     async def _get_conditions(self, query_text: str) -> str:
         """Get ski conditions for a query.
@@ -203,7 +295,7 @@ Based on this data, please answer the following question:
 
         try:
             # Pre-fetch ski conditions
-            conditions_data = await fetch_ski_conditions_impl()
+            conditions_data = await self._get_cached_conditions()
 
             # Build prompt with conditions data
             prompt = self._build_prompt_with_data(query_text, conditions_data)
@@ -216,10 +308,10 @@ Based on this data, please answer the following question:
                 messages=[{"role": "user", "content": prompt}],
             )
 
-            response_text = ""
-            for block in response.content:
-                if hasattr(block, "text"):
-                    response_text += block.text
+            # Pick text blocks by their type tag rather than probing attributes
+            response_text = "".join(
+                block.text for block in response.content if block.type == "text"
+            )
 
             if not response_text:
                 response_text = (
@@ -242,7 +334,7 @@ Based on this data, please answer the following question:
         Returns:
             Agent's response as string
         """
-        return asyncio.run(self._get_conditions(query_text))
+        return run_coroutine(self._get_conditions(query_text))
 
 
 def create_ski_agent() -> SkiAgent:
@@ -251,10 +343,10 @@ def create_ski_agent() -> SkiAgent:
     Returns:
         Configured SkiAgent instance
     """
-    config = SkiAgentConfig()
-    return SkiAgent(config)
+    return SkiAgent(DEFAULT_CONFIG)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     agent = create_ski_agent()
     print(agent.get_conditions("What's the ski report at Meadows?"))
@@ -1,14 +1,18 @@
 """Configuration for Ski Agent."""
 
 import threading
-from collections import deque
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 
 
 class RateLimiter:
-    """Thread-safe rate limiter using sliding window algorithm."""
+    """Thread-safe rate limiter using a token bucket.
+
+    The bucket holds up to max_calls tokens and refills continuously at
+    max_calls per time window, so each check is O(1).
+    """
 
     def __init__(self, max_calls: int, time_window: timedelta) -> None:
         """Initialize rate limiter.
@@ -19,7 +23,9 @@ class RateLimiter:
         """
         self.max_calls = max_calls
         self.time_window = time_window
-        self.calls: deque[datetime] = deque()
+        self._refill_per_second = max_calls / time_window.total_seconds()
+        self._tokens = float(max_calls)
+        self._last_refill = time.monotonic()
         self._lock = threading.Lock()
 
     def check_rate_limit(self) -> bool:
@@ -28,19 +34,19 @@ class RateLimiter:
         Returns:
             True if within rate limit, False otherwise
         """
-        now = datetime.now()
-
         with self._lock:
-            # Remove old calls outside the time window
-            while self.calls and self.calls[0] < now - self.time_window:
-                self.calls.popleft()
-
-            # Check if we've exceeded the limit
-            if len(self.calls) >= self.max_calls:
+            now = time.monotonic()
+            elapsed = now - self._last_refill
+            self._tokens = min(
+                self.max_calls, self._tokens + elapsed * self._refill_per_second
+            )
+            self._last_refill = now
+
+            if self._tokens < 1.0:
                 return False
 
-            # Record this call
-            self.calls.append(now)
+            # Spend a token for this call
+            self._tokens -= 1.0
             return True
 
 
@@ -63,9 +69,14 @@ class CachedConditions:
         return datetime.now() - self.timestamp > timedelta(minutes=ttl_minutes)
 
 
-@dataclass
+_DEFAULT_LOG_DIR = (
+    Path(__file__).parent.parent.parent / "logs" / "ski_agent"
+).resolve()
+
+
+@dataclass(frozen=True, slots=True)
 class SkiAgentConfig:
-    """Configuration for Ski Agent."""
+    """Configuration for Ski Agent (immutable, so one instance can be shared)."""
 
     # Model configuration
     model: str = "claude-3-5-haiku-20241022"
@@ -81,9 +92,12 @@ class SkiAgentConfig:
     max_requests_per_minute: int = 5
 
     # Logging
-    log_dir: Path = Path(__file__).parent.parent.parent / "logs" / "ski_agent"
+    log_dir: Path = _DEFAULT_LOG_DIR
 
     def __post_init__(self) -> None:
         """Ensure paths are Path objects."""
         if not isinstance(self.log_dir, Path):
-            self.log_dir = Path(self.log_dir)
+            object.__setattr__(self, "log_dir", Path(self.log_dir))
+
+
+DEFAULT_CONFIG = SkiAgentConfig()
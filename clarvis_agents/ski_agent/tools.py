@@ -1,11 +1,26 @@
 """Native tools for Ski Agent using Claude Agent SDK."""
 
 import logging
+import os
+import re
+import time
+from html.parser import HTMLParser
 from typing import Optional
 
 import httpx
 from claude_agent_sdk import create_sdk_mcp_server, tool
 
+from ..core.event_loop import LoopLocal
+
+# h2 enables HTTP/2 (multiplexing, header compression) in httpx; without it
+# the client speaks HTTP/1.1
+try:
+    import h2  # noqa: F401
+
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
 logger = logging.getLogger(__name__)
 
 # Default URL for Mt Hood Meadows conditions
@@ -33,50 +48,292 @@ def get_conditions_url() -> str:
     return _conditions_url
 
 
+def _new_http_client() -> httpx.AsyncClient:
+    """Create the HTTP client used for conditions fetches on one event loop."""
+    return httpx.AsyncClient(
+        # Fail fast on an unreachable server; reads keep the full budget
+        timeout=httpx.Timeout(15.0, connect=5.0),
+        follow_redirects=True,
+        headers={"User-Agent": "Clarvis-SkiAgent/1.0 (Home Assistant Integration)"},
+        limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+        http2=HAS_H2,
+    )
+
+
+# Shared HTTP client, one per event loop: an httpx connection pool can't be
+# used from a loop other than the one that opened it. Each client is closed
+# when its loop shuts down.
+_http_clients: LoopLocal[httpx.AsyncClient] = LoopLocal(
+    _new_http_client, lambda client: client.aclose()
+)
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the HTTP client for the running event loop, creating it on first use.
+
+    Reusing the client keeps the connection to the conditions server alive
+    between fetches instead of paying a new TLS handshake each time.
+
+    Returns:
+        Shared httpx.AsyncClient for the running loop.
+    """
+    return _http_clients.get()
+
+
+# Largest conditions page accepted, in decoded bytes. The real page is a
+# small fraction of this; the cap bounds memory if the server misbehaves.
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+# URL -> (conditional request headers, extracted text) from the last full
+# response that carried validators. Lets unchanged pages come back as 304.
+_last_responses: dict[str, tuple[dict[str, str], str]] = {}
+
+
+def _cache_ttl_from_env(default: int = 60) -> int:
+    """Read the page cache lifetime from CLARVIS_SKI_CACHE_TTL.
+
+    Args:
+        default: Seconds to use when the variable is unset or invalid.
+
+    Returns:
+        Whole seconds a fetched page is reused.
+    """
+    raw = os.environ.get("CLARVIS_SKI_CACHE_TTL", str(default)).strip()
+    if raw.isdecimal():
+        return int(raw)
+    logger.warning("Invalid CLARVIS_SKI_CACHE_TTL %r; using %d seconds", raw, default)
+    return default
+
+
+# Seconds a fetched page is reused without contacting the server, unless the
+# response's Cache-Control max-age says otherwise. SkiAgent keeps its own
+# cache on top of this one (SkiAgentConfig.cache_ttl_minutes).
+CACHE_TTL_SECONDS = _cache_ttl_from_env()
+
+# URL -> (time.monotonic() deadline, time.monotonic() fetched, extracted text)
+# of the last good fetch. Past the deadline the text is still served, marked
+# stale, if a refetch fails and the text is at most MAX_STALE_SECONDS old.
+_page_cache: dict[str, tuple[float, float, str]] = {}
+
+# Oldest page text served in place of a fetch error
+MAX_STALE_SECONDS = 60 * 60
+
+# Starts text served after a failed fetch, so callers don't treat it as fresh
+STALE_PREFIX = "Stale:"
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+async def close_http_client() -> None:
+    """Close the running event loop's shared HTTP client, if it has one.
+
+    Clients of other loops are closed when those loops shut down.
+    """
+    await _http_clients.aclose()
+
+
+class _TextExtractor(HTMLParser):
+    """Collects the visible text of an HTML page, one line per block element."""
+
+    # Elements whose content is never shown as page text
+    _HIDDEN_TAGS = frozenset({"script", "style", "noscript", "template"})
+    # Elements that start a new line of text
+    _BLOCK_TAGS = frozenset(
+        {"br", "div", "h1", "h2", "h3", "h4", "h5", "h6", "li", "p", "section", "tr"}
+    )
+    # Table cells stay on their row's line, separated by a space
+    _CELL_TAGS = frozenset({"td", "th"})
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+        self._hidden_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        if tag in self._HIDDEN_TAGS:
+            self._hidden_depth += 1
+        elif tag in self._BLOCK_TAGS:
+            self.parts.append("\n")
+        elif tag in self._CELL_TAGS:
+            self.parts.append(" ")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self._HIDDEN_TAGS:
+            if self._hidden_depth:
+                self._hidden_depth -= 1
+        elif tag in self._BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data: str) -> None:
+        if not self._hidden_depth:
+            self.parts.append(data)
+
+
+def extract_conditions_text(html: str) -> str:
+    """Reduce a conditions page to its visible text.
+
+    Markup, scripts and styles make up most of the page but carry none of the
+    conditions, so dropping them keeps the prompt built from it small.
+
+    Args:
+        html: Raw HTML of the conditions page.
+
+    Returns:
+        Visible text with whitespace collapsed, one block element per line.
+        The input is returned unchanged if it has no visible text.
+    """
+    extractor = _TextExtractor()
+    extractor.feed(html)
+    extractor.close()
+    lines = (" ".join(line.split()) for line in "".join(extractor.parts).splitlines())
+    return "\n".join(line for line in lines if line) or html
+
+
 # Implementation functions (testable without SDK)
 
 
 async def fetch_ski_conditions_impl(url: Optional[str] = None) -> str:
     """Fetch ski conditions from the specified URL.
 
+    Pages are reused for CACHE_TTL_SECONDS (or the server's max-age) without
+    a request. After that, fetches are conditional (If-None-Match /
+    If-Modified-Since), so an unchanged page is answered with a bodiless 304
+    and the previous text. If a fetch fails, the last good text up to
+    MAX_STALE_SECONDS old is returned in place of the error, prefixed with
+    STALE_PREFIX and its age.
+
     Args:
         url: URL to fetch conditions from. Defaults to cloudserv.skihood.com.
 
     Returns:
-        Raw HTML/text content from the conditions page.
+        Visible text content of the conditions page, or an "Error: ..." message.
     """
     target_url = url or get_conditions_url()
-    logger.info(f"Fetching ski conditions from {target_url}")
+    cached = _page_cache.get(target_url)
+    if cached and time.monotonic() < cached[0]:
+        logger.info("Using cached conditions")
+        return cached[2]
+
+    logger.info("Fetching ski conditions from %s", target_url)
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                target_url,
-                timeout=15.0,
-                follow_redirects=True,
-                headers={
-                    "User-Agent": "Clarvis-SkiAgent/1.0 (Home Assistant Integration)"
-                },
-            )
+        last = _last_responses.get(target_url)
+        async with _get_http_client().stream(
+            "GET", target_url, headers=last[0] if last else None
+        ) as response:
+            if last and response.status_code == 304:
+                logger.info("Conditions unchanged since last fetch")
+                _cache_page(target_url, last[1], response)
+                return last[1]
+
             response.raise_for_status()
-            logger.info(f"Successfully fetched conditions ({len(response.text)} bytes)")
-            return response.text
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body += chunk
+                if len(body) > MAX_PAGE_BYTES:
+                    logger.error("Conditions page exceeds %d bytes", MAX_PAGE_BYTES)
+                    return _stale_or(
+                        target_url,
+                        "Error: The ski conditions page is too large to process.",
+                    )
+
+        logger.info(
+            "Successfully fetched conditions (%d bytes, %s sent)",
+            len(body),
+            response.headers.get("Content-Length", "unknown"),
+        )
+        text = extract_conditions_text(
+            body.decode(response.encoding or "utf-8", errors="replace")
+        )
+
+        validators = {}
+        if etag := response.headers.get("ETag"):
+            validators["If-None-Match"] = etag
+        if last_modified := response.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = last_modified
+        if validators:
+            _last_responses[target_url] = (validators, text)
+        _cache_page(target_url, text, response)
+        return text
 
     except httpx.TimeoutException:
-        logger.error(f"Timeout fetching conditions from {target_url}")
-        return "Error: Request timed out. The ski conditions server may be slow or unavailable."
+        logger.error("Timeout fetching conditions from %s", target_url)
+        return _stale_or(
+            target_url,
+            "Error: Request timed out. The ski conditions server may be slow or unavailable.",
+        )
 
     except httpx.HTTPStatusError as e:
-        logger.error(f"HTTP error fetching conditions: {e.response.status_code}")
-        return f"Error: Server returned status {e.response.status_code}. Unable to fetch conditions."
+        logger.error("HTTP error fetching conditions: %d", e.response.status_code)
+        return _stale_or(
+            target_url,
+            f"Error: Server returned status {e.response.status_code}. Unable to fetch conditions.",
+        )
 
     except httpx.RequestError as e:
-        logger.error(f"Request error fetching conditions: {e}")
-        return "Error: Unable to connect to ski conditions server. Please try again later."
+        logger.error("Request error fetching conditions: %s", e)
+        return _stale_or(
+            target_url,
+            "Error: Unable to connect to ski conditions server. Please try again later.",
+        )
 
     except Exception as e:
-        logger.error(f"Unexpected error fetching conditions: {e}", exc_info=True)
-        return "Error: An unexpected error occurred while fetching conditions. Please try again later."
+        logger.error("Unexpected error fetching conditions: %s", e, exc_info=True)
+        return _stale_or(
+            target_url,
+            "Error: An unexpected error occurred while fetching conditions. Please try again later.",
+        )
+
+
+def _cache_page(url: str, text: str, response: httpx.Response) -> None:
+    """Remember a page's text until its freshness lifetime runs out.
+
+    Honors the response's Cache-Control: no-store keeps nothing for the URL
+    (not even validators or stale-on-error text), no-cache revalidates on
+    every fetch, and max-age replaces CACHE_TTL_SECONDS.
+
+    Args:
+        url: URL the page was fetched from.
+        text: Extracted text to serve from the cache.
+        response: Response the text came from, for its Cache-Control header.
+    """
+    cache_control = response.headers.get("Cache-Control", "").lower()
+    if "no-store" in cache_control:
+        _page_cache.pop(url, None)
+        _last_responses.pop(url, None)
+        return
+
+    ttl = CACHE_TTL_SECONDS
+    if "no-cache" in cache_control:
+        ttl = 0
+    elif match := _MAX_AGE_RE.search(cache_control):
+        ttl = float(match.group(1))
+    now = time.monotonic()
+    _page_cache[url] = (now + ttl, now, text)
+
+
+def _stale_or(url: str, error: str) -> str:
+    """Fall back to the last good text for a URL when a fetch fails.
+
+    Args:
+        url: URL that failed to fetch.
+        error: Error message to return if nothing was fetched before.
+
+    Returns:
+        The previously fetched text marked with STALE_PREFIX, or error if
+        there is none younger than MAX_STALE_SECONDS.
+    """
+    cached = _page_cache.get(url)
+    if cached is None:
+        return error
+    age = time.monotonic() - cached[1]
+    if age > MAX_STALE_SECONDS:
+        return error
+    logger.warning("Serving %d-second-old conditions after a failed fetch", age)
+    return (
+        f"{STALE_PREFIX} The conditions page could not be refreshed; this data"
+        f" was fetched {round(age / 60)} minutes ago.\n\n{cached[2]}"
+    )
 
 
 # SDK Tool definitions
@@ -84,7 +341,7 @@ async def fetch_ski_conditions_impl(url: Optional[str] = None) -> str:
 
 @tool(
     name="fetch_ski_conditions",
-    description="Fetch current ski conditions from Mt Hood Meadows. Returns raw HTML/text content with snow depths, lift status, weather, and other conditions data.",
+    description="Fetch current ski conditions from Mt Hood Meadows. Returns the page text with snow depths, lift status, weather, and other conditions data.",
     input_schema={
         "type": "object",
         "properties": {
@@ -3,12 +3,8 @@
 This provider is called by promptfoo to get routing decisions.
 """
 
-import asyncio
-import json
 from typing import Any
 
-from shared import get_routing_decision
-
 
 def call_api(prompt: str, options: dict, context: dict) -> dict[str, Any]:
     """Promptfoo provider entry point.
@@ -21,13 +17,18 @@ def call_api(prompt: str, options: dict, context: dict) -> dict[str, Any]:
     Returns:
         Dict with 'output' key containing the routing decision JSON.
     """
+    # Deferred so loading the provider doesn't import the agent framework
+    from shared import dumps_decision, get_routing_decision
+
+    from clarvis_agents.core.event_loop import run_coroutine
+
     # Get configuration from options or context
     vars_dict = context.get("vars", {})
     enable_llm = vars_dict.get("enable_llm", False)
     context_json = vars_dict.get("context")
 
-    # Run the router
-    result = asyncio.run(get_routing_decision(prompt, enable_llm, context_json))
+    # Run the router on a loop that persists across promptfoo calls
+    result = run_coroutine(get_routing_decision(prompt, enable_llm, context_json))
 
     # Return as JSON string (promptfoo expects this format)
-    return {"output": json.dumps(result)}
+    return {"output": dumps_decision(result)}
@@ -14,14 +14,35 @@ Usage (stdin - for manual testing):
 Usage (args - used by promptfoo):
     python evals/run_router.py "check my email"
     python evals/run_router.py "hello"
+
+Usage (server - one query per stdin line, one JSON object per output line):
+    printf 'check my email\nhello\n' | python evals/run_router.py --server
 """
 
 import argparse
-import asyncio
-import json
 import sys
+from typing import Optional
+
+
+def serve(enable_llm: bool, context_json: Optional[str]) -> None:
+    """Route queries read from stdin, one per line, until EOF.
+
+    Avoids paying interpreter startup and imports for every query.
+
+    Args:
+        enable_llm: If True, enable LLM routing for ambiguous queries.
+        context_json: Optional JSON context applied to every query.
+    """
+    from shared import dumps_decision, get_routing_decision
+
+    from clarvis_agents.core.event_loop import run_coroutine
 
-from shared import get_routing_decision
+    for line in sys.stdin:
+        query = line.strip()
+        if not query:
+            continue
+        result = run_coroutine(get_routing_decision(query, enable_llm, context_json))
+        print(dumps_decision(result), flush=True)
 
 
 def main() -> None:
@@ -46,10 +67,24 @@ def main() -> None:
         default=None,
         help="JSON context for follow-up detection tests",
     )
+    parser.add_argument(
+        "--server",
+        action="store_true",
+        help="Route each stdin line until EOF, reusing one router process",
+    )
 
     # Parse known args to handle extra args from promptfoo
     args, _ = parser.parse_known_args()
 
+    if args.server:
+        serve(args.llm, args.context)
+        return
+
+    # Deferred so --help doesn't load the agent framework
+    from shared import dumps_decision, get_routing_decision
+
+    from clarvis_agents.core.event_loop import run_coroutine
+
     # Get query from argument or stdin
     if args.query:
         query = args.query
@@ -57,10 +92,10 @@ def main() -> None:
         query = sys.stdin.read().strip()
 
     # Run the router
-    result = asyncio.run(get_routing_decision(query, args.llm, args.context))
+    result = run_coroutine(get_routing_decision(query, args.llm, args.context))
 
     # Output as JSON
-    print(json.dumps(result))
+    print(dumps_decision(result))
 
 
 if __name__ == "__main__":
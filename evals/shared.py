@@ -4,10 +4,11 @@ This module contains common code used by both the promptfoo provider
 and the CLI run_router.py script.
 """
 
+import functools
 import json
 import os
 import sys
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 # Add project root to path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -22,6 +23,17 @@ from clarvis_agents.core import (
     ConversationTurn,
 )
 
+if TYPE_CHECKING:
+    from clarvis_agents.orchestrator.router import IntentRouter
+
+# orjson is an optional, faster JSON encoder; the stdlib is used without it
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 class MockAgent(BaseAgent):
     """Mock agent for testing routing without real agent dependencies."""
@@ -76,9 +88,12 @@ class MockAgent(BaseAgent):
         return True
 
 
+@functools.lru_cache(maxsize=1)
 def setup_registry() -> AgentRegistry:
     """Set up the agent registry with mock agents matching production setup.
 
+    Built once per process; later calls return the same registry.
+
     Returns:
         AgentRegistry populated with mock agents.
     """
@@ -132,46 +147,55 @@ def parse_context(context_json: Optional[str]) -> Optional[ConversationContext]:
     if not ctx_data:
         return None
 
-    context = ConversationContext(session_id="test")
-    context.last_agent = ctx_data.get("last_agent")
-
-    for turn in ctx_data.get("turns", []):
-        context.turns.append(
+    return ConversationContext(
+        session_id="test",
+        last_agent=ctx_data.get("last_agent"),
+        turns=[
             ConversationTurn(
                 query=turn.get("query", ""),
                 response=turn.get("response", ""),
                 agent_used=turn.get("agent_used", ""),
             )
-        )
+            for turn in ctx_data.get("turns", [])
+        ],
+    )
 
-    return context
 
-
-async def get_routing_decision(
-    query: str, enable_llm: bool = False, context_json: Optional[str] = None
-) -> dict[str, Any]:
-    """Run the router and return the routing decision as a dict.
+@functools.lru_cache(maxsize=2)
+def get_router(enable_llm: bool = False) -> "IntentRouter":
+    """Get the router for the mock registry, building it on first use.
 
     Args:
-        query: The user query to route.
         enable_llm: If True, enable LLM routing for ambiguous queries.
-        context_json: Optional JSON string with conversation context.
 
     Returns:
-        Dict with routing decision fields.
+        IntentRouter shared by every query with the same enable_llm setting.
     """
     from clarvis_agents.orchestrator.config import OrchestratorConfig
     from clarvis_agents.orchestrator.router import IntentRouter
 
-    registry = setup_registry()
-
     config = OrchestratorConfig(
         llm_routing_enabled=enable_llm,
         code_routing_threshold=0.7,
         follow_up_detection=True,
     )
+    return IntentRouter(setup_registry(), config)
+
+
+async def get_routing_decision(
+    query: str, enable_llm: bool = False, context_json: Optional[str] = None
+) -> dict[str, Any]:
+    """Run the router and return the routing decision as a dict.
+
+    Args:
+        query: The user query to route.
+        enable_llm: If True, enable LLM routing for ambiguous queries.
+        context_json: Optional JSON string with conversation context.
 
-    router = IntentRouter(registry, config)
+    Returns:
+        Dict with routing decision fields.
+    """
+    router = get_router(enable_llm)
     context = parse_context(context_json)
     decision = await router.route(query, context=context)
 
@@ -181,3 +205,17 @@ async def get_routing_decision(
         "reasoning": decision.reasoning,
         "handle_directly": decision.handle_directly,
     }
+
+
+def dumps_decision(decision: dict[str, Any]) -> str:
+    """Encode a routing decision as JSON, using orjson when it is installed.
+
+    Args:
+        decision: Routing decision from get_routing_decision.
+
+    Returns:
+        JSON string for promptfoo or the command line.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(decision).decode()
+    return json.dumps(decision)
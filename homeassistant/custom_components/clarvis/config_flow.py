@@ -69,8 +69,10 @@ class ClarvisConfigFlow(ConfigFlow, domain=DOMAIN):
 
         try:
             session = async_get_clientsession(self.hass)
+            # A host that isn't listening fails within seconds instead of
+            # holding the setup form for the whole budget
             async with session.get(
-                url, timeout=aiohttp.ClientTimeout(total=10)
+                url, timeout=aiohttp.ClientTimeout(total=10, sock_connect=2)
             ) as response:
                 if response.status == 200:
                     data = await response.json()
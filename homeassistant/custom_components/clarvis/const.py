@@ -1,6 +1,7 @@
 """Constants for the Clarvis AI Assistant integration."""
 
 import os
+import re
 
 DOMAIN = "clarvis"
 
@@ -12,14 +13,11 @@ CONF_API_PORT = "api_port"
 # For local development, use localhost. For production, set CLARVIS_API_HOST.
 DEFAULT_API_HOST = os.environ.get("CLARVIS_API_HOST", "localhost")
 
-# Parse port with validation and fallback
-try:
-    _port = int(os.environ.get("CLARVIS_API_PORT", "8000"))
-    if not 1 <= _port <= 65535:
-        raise ValueError(f"Port {_port} out of valid range (1-65535)")
-    DEFAULT_API_PORT = _port
-except (ValueError, TypeError):
-    DEFAULT_API_PORT = 8000  # Fallback to safe default
+# Parse port with validation, falling back to a safe default for non-numeric
+# or out-of-range (1-65535) values
+_port_str = os.environ.get("CLARVIS_API_PORT", "8000").strip()
+_port = int(_port_str) if _port_str.isdecimal() else 0
+DEFAULT_API_PORT = _port if 1 <= _port <= 65535 else 8000
 
 DEFAULT_TIMEOUT = 120
 
@@ -53,3 +51,9 @@ HA_COMMAND_KEYWORDS = [
     "mute",
     "unmute",
 ]
+
+# All keywords as one case-insensitive pattern, so detection is a single scan
+# of the query instead of one substring search per keyword
+HA_COMMAND_PATTERN = re.compile(
+    "|".join(map(re.escape, HA_COMMAND_KEYWORDS)), re.IGNORECASE
+)
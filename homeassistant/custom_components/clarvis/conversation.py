@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+from contextlib import aclosing
 from typing import TYPE_CHECKING, Any, AsyncGenerator, Literal, Optional
 
 import aiohttp
@@ -16,6 +17,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import intent
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util.json import json_loads
 
 # Try to import ChatLog streaming support (HA 2025.7+)
 try:
@@ -43,7 +45,7 @@ from .const import (
     CONF_API_PORT,
     DEFAULT_TIMEOUT,
     DOMAIN,
-    HA_COMMAND_KEYWORDS,
+    HA_COMMAND_PATTERN,
     ORCHESTRATOR_QUERY_ENDPOINT,
     ORCHESTRATOR_STREAM_ENDPOINT,
 )
@@ -53,6 +55,9 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared by every API request; ClientTimeout is immutable
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -63,6 +68,52 @@ async def async_setup_entry(
     async_add_entities([ClarvisConversationEntity(config_entry)])
 
 
+def _sse_data_value(line: bytes) -> bytes:
+    """Return the value of an SSE "data:" line, minus one leading space."""
+    value = line[5:]
+    return value[1:] if value.startswith(b" ") else value
+
+
+async def _iter_sse_data(
+    content: aiohttp.StreamReader,
+) -> AsyncGenerator[bytes, None]:
+    """Yield the data of each SSE event in a response body.
+
+    Reads the body in raw chunks and splits lines in a local buffer. Lines may
+    end in LF or CRLF. The data lines of one event are joined with newlines
+    and yielded at the blank line that ends it. Payloads stay bytes, since
+    the JSON parser reads UTF-8 directly.
+
+    Args:
+        content: Body of the streaming response.
+
+    Yields:
+        Data of each event that has at least one data line.
+    """
+    buffer = bytearray()
+    data_lines: list[bytes] = []
+    async for chunk, _ in content.iter_chunks():
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            line = bytes(buffer[start:end]).rstrip(b"\r")
+            start = end + 1
+            if not line:
+                if data_lines:
+                    yield b"\n".join(data_lines)
+                    data_lines = []
+            elif line.startswith(b"data:"):
+                data_lines.append(_sse_data_value(line))
+        del buffer[:start]
+
+    # A final event without its closing blank line or trailing newline
+    line = bytes(buffer).rstrip(b"\r")
+    if line.startswith(b"data:"):
+        data_lines.append(_sse_data_value(line))
+    if data_lines:
+        yield b"\n".join(data_lines)
+
+
 class ClarvisConversationEntity(ConversationEntity):
     """Clarvis conversation agent entity."""
 
@@ -75,6 +126,15 @@ class ClarvisConversationEntity(ConversationEntity):
         self._config_entry = config_entry
         self._attr_unique_id = f"{DOMAIN}_{config_entry.entry_id}"
 
+        # Options updates reload the entry, which recreates this entity, so
+        # the API URLs can be built once here
+        base_url = (
+            f"http://{config_entry.data.get(CONF_API_HOST)}"
+            f":{config_entry.data.get(CONF_API_PORT)}"
+        )
+        self._query_url = f"{base_url}{ORCHESTRATOR_QUERY_ENDPOINT}"
+        self._stream_url = f"{base_url}{ORCHESTRATOR_STREAM_ENDPOINT}"
+
     @property
     def supported_languages(self) -> list[str] | Literal["*"]:
         """Return a list of supported languages."""
@@ -151,8 +211,7 @@ class ClarvisConversationEntity(ConversationEntity):
 
     def _is_ha_command(self, text: str) -> bool:
         """Detect if query looks like a Home Assistant device command."""
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in HA_COMMAND_KEYWORDS)
+        return HA_COMMAND_PATTERN.search(text) is not None
 
     async def _stream_from_api(
         self, user_input: ConversationInput
@@ -165,10 +224,6 @@ class ClarvisConversationEntity(ConversationEntity):
         Yields:
             Text chunks as they arrive from the API.
         """
-        host = self._config_entry.data.get(CONF_API_HOST)
-        port = self._config_entry.data.get(CONF_API_PORT)
-        url = f"http://{host}:{port}{ORCHESTRATOR_STREAM_ENDPOINT}"
-
         session = async_get_clientsession(self.hass)
 
         payload = {"query": user_input.text}
@@ -177,9 +232,9 @@ class ClarvisConversationEntity(ConversationEntity):
 
         try:
             async with session.post(
-                url,
+                self._stream_url,
                 json=payload,
-                timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT),
+                timeout=_REQUEST_TIMEOUT,
             ) as resp:
                 if resp.status != 200:
                     _LOGGER.warning(
@@ -188,14 +243,12 @@ class ClarvisConversationEntity(ConversationEntity):
                     return
 
                 # Read SSE stream
-                async for line in resp.content:
-                    line = line.decode("utf-8").strip()
-                    if line.startswith("data: "):
-                        data_str = line[6:]  # Remove "data: " prefix
-                        if data_str == "[DONE]":
+                async with aclosing(_iter_sse_data(resp.content)) as events:
+                    async for data_bytes in events:
+                        if data_bytes == b"[DONE]":
                             break
                         try:
-                            data = json.loads(data_str)
+                            data = json_loads(data_bytes)
                             if "text" in data:
                                 yield data["text"]
                             elif "error" in data:
@@ -204,7 +257,10 @@ class ClarvisConversationEntity(ConversationEntity):
                                 )
                                 yield f"Error: {data['error']}"
                         except json.JSONDecodeError:
-                            _LOGGER.warning("Invalid JSON in SSE: %s", data_str)
+                            _LOGGER.warning(
+                                "Invalid JSON in SSE: %s",
+                                data_bytes.decode("utf-8", errors="replace"),
+                            )
 
         except aiohttp.ClientError as err:
             _LOGGER.error("Error streaming from Clarvis API: %s", err)
@@ -220,10 +276,6 @@ class ClarvisConversationEntity(ConversationEntity):
             ConversationResult if orchestrator handled the query,
             None if we should fall back to default agent.
         """
-        host = self._config_entry.data.get(CONF_API_HOST)
-        port = self._config_entry.data.get(CONF_API_PORT)
-        url = f"http://{host}:{port}{ORCHESTRATOR_QUERY_ENDPOINT}"
-
         session = async_get_clientsession(self.hass)
 
         # Build request payload
@@ -235,12 +287,12 @@ class ClarvisConversationEntity(ConversationEntity):
 
         try:
             async with session.post(
-                url,
+                self._query_url,
                 json=payload,
-                timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT),
+                timeout=_REQUEST_TIMEOUT,
             ) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = await resp.json(loads=json_loads)
                     return self._process_orchestrator_response(data, user_input)
                 else:
                     _LOGGER.warning(
@@ -333,12 +385,7 @@ class ClarvisConversationEntity(ConversationEntity):
             return await default_agent.async_process(user_input)
 
         # No default agent available
-        intent_response = intent.IntentResponse(language=user_input.language)
-        intent_response.async_set_speech(
-            "I'm sorry, I couldn't connect to Clarvis and no other assistant is available."
-        )
-
-        return ConversationResult(
-            response=intent_response,
-            conversation_id=user_input.conversation_id,
+        return self._build_response(
+            "I'm sorry, I couldn't connect to Clarvis and no other assistant is available.",
+            user_input,
         )
@@ -0,0 +1,155 @@
+"""Tests for the synchronous coroutine runner."""
+
+import asyncio
+import gc
+import weakref
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from clarvis_agents.core import event_loop
+from clarvis_agents.core.event_loop import LoopLocal, run_coroutine
+
+
+class TestRunCoroutine:
+    """Test suite for run_coroutine."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_runner(self):
+        """Give each test its own runner, closing it afterwards."""
+        event_loop._local.runner = None
+        yield
+        if event_loop._local.runner is not None:
+            event_loop._local.runner.close()
+        event_loop._local.runner = None
+
+    def test_returns_coroutine_result(self):
+        """Test that run_coroutine returns what the coroutine returns."""
+
+        async def answer():
+            await asyncio.sleep(0)
+            return 42
+
+        assert run_coroutine(answer()) == 42
+
+    def test_propagates_exceptions(self):
+        """Test that exceptions raised by the coroutine reach the caller."""
+
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            run_coroutine(fail())
+
+    def test_event_loop_persists_between_calls(self):
+        """Test that consecutive calls on a thread share one event loop."""
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = run_coroutine(current_loop())
+        second = run_coroutine(current_loop())
+
+        assert first is second
+        assert not first.is_closed()
+
+    def test_uses_uvloop_when_available(self):
+        """Test that uvloop's loop factory is used when uvloop is installed."""
+        fake_uvloop = MagicMock()
+        fake_uvloop.new_event_loop = MagicMock(side_effect=asyncio.new_event_loop)
+
+        async def answer():
+            return "done"
+
+        with patch.object(event_loop, "HAS_UVLOOP", True), patch.object(
+            event_loop, "uvloop", fake_uvloop, create=True
+        ):
+            assert run_coroutine(answer()) == "done"
+
+        fake_uvloop.new_event_loop.assert_called_once()
+
+
+class LoopBoundResource:
+    """Resource that, like a used connection pool, holds its event loop."""
+
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.closed_on = None
+
+    async def aclose(self):
+        self.closed_on = asyncio.get_running_loop()
+
+
+class TestLoopLocal:
+    """Test suite for LoopLocal."""
+
+    @pytest.fixture
+    def slot(self):
+        """Per-loop slot holding LoopBoundResource instances."""
+        return LoopLocal(LoopBoundResource, LoopBoundResource.aclose)
+
+    def test_one_resource_per_loop(self, slot):
+        """Test that a loop reuses its resource and other loops get their own."""
+
+        async def get_twice():
+            first = slot.get()
+            assert slot.get() is first
+            return first
+
+        first = asyncio.run(get_twice())
+        second = asyncio.run(get_twice())
+
+        assert first is not second
+
+    def test_closed_and_released_at_loop_shutdown(self, slot):
+        """Test that shutting a loop down closes its resource and frees the loop."""
+
+        async def get_resource():
+            return slot.get()
+
+        resources = [asyncio.run(get_resource()) for _ in range(2)]
+
+        assert all(r.closed_on is r.loop for r in resources)
+        assert len(slot) == 0
+
+        loops = [weakref.ref(r.loop) for r in resources]
+        del resources
+        gc.collect()
+        assert all(loop() is None for loop in loops)
+
+    def test_closed_when_runner_closes(self, slot):
+        """Test that run_coroutine's loop closes its resource on runner close."""
+        event_loop._local.runner = None
+
+        async def get_resource():
+            return slot.get()
+
+        try:
+            resource = run_coroutine(get_resource())
+            assert run_coroutine(get_resource()) is resource
+            assert resource.closed_on is None
+        finally:
+            event_loop._local.runner.close()
+            event_loop._local.runner = None
+
+        assert resource.closed_on is resource.loop
+        assert len(slot) == 0
+
+    def test_aclose_closes_now(self, slot):
+        """Test that aclose() closes the resource and the next get() replaces it."""
+
+        async def close_and_reopen():
+            first = slot.get()
+            await slot.aclose()
+            assert first.closed_on is first.loop
+            assert len(slot) == 0
+            return first, slot.get()
+
+        first, second = asyncio.run(close_and_reopen())
+
+        assert second is not first
+        assert second.closed_on is second.loop
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
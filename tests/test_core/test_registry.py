@@ -200,6 +200,24 @@ class TestAgentRegistry:
         assert registry1 is not registry2
         assert registry2.list_agents() == []
 
+    def test_version_bumps_on_mutation(self):
+        """Test that version changes when the agent set changes."""
+        registry = AgentRegistry()
+        start = registry.version
+
+        registry.register(MockAgent("agent1"))
+        after_register = registry.version
+        registry.unregister("missing")
+        after_noop = registry.version
+        registry.unregister("agent1")
+        after_unregister = registry.version
+        registry.clear()
+
+        assert after_register > start
+        assert after_noop == after_register
+        assert after_unregister > after_register
+        assert registry.version > after_unregister
+
 
 class TestAgentRegistryEdgeCases:
     """Additional edge case tests for AgentRegistry."""
@@ -244,6 +262,25 @@ class TestAgentRegistryEdgeCases:
         assert health["healthy"] is True
         assert health["unhealthy"] is False
 
+    def test_health_check_any_stops_at_first_healthy(self):
+        """Test health_check_any short-circuits on the first healthy agent."""
+        registry = AgentRegistry()
+        registry.register(MockAgent("unhealthy", healthy=False))
+        registry.register(MockAgent("healthy", healthy=True))
+        never_checked = MockAgent("later")
+        never_checked.health_check = lambda: pytest.fail("should not be checked")
+        registry.register(never_checked)
+
+        assert registry.health_check_any() is True
+
+    def test_health_check_any_with_no_healthy_agents(self):
+        """Test health_check_any is False when nothing is healthy or registered."""
+        registry = AgentRegistry()
+        assert registry.health_check_any() is False
+
+        registry.register(MockAgent("unhealthy", healthy=False))
+        assert registry.health_check_any() is False
+
     def test_register_many_agents(self):
         """Test registering many agents."""
         registry = AgentRegistry()
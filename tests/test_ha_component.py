@@ -61,6 +61,43 @@ def load_const_module():
     return namespace
 
 
+def load_sse_parser():
+    """Load _iter_sse_data from conversation.py without triggering HA imports."""
+    conversation_path = COMPONENT_BASE / "conversation.py"
+    with open(conversation_path) as f:
+        tree = ast.parse(f.read())
+    # Keep the __future__ import so annotations naming aiohttp stay unevaluated
+    tree.body = [
+        node
+        for node in tree.body
+        if (isinstance(node, ast.ImportFrom) and node.module == "__future__")
+        or (
+            isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+            and node.name in ("_sse_data_value", "_iter_sse_data")
+        )
+    ]
+    namespace = {}
+    exec(compile(tree, str(conversation_path), "exec"), namespace)
+    return namespace["_iter_sse_data"]
+
+
+class FakeStreamReader:
+    """Stand-in for aiohttp.StreamReader that replays fixed body chunks."""
+
+    def __init__(self, chunks: list[bytes]):
+        self._chunks = chunks
+
+    async def iter_chunks(self):
+        for chunk in self._chunks:
+            yield chunk, True
+
+
+async def collect_sse_data(chunks: list[bytes]) -> list[bytes]:
+    """Run _iter_sse_data over the given chunks and collect the payloads."""
+    iter_sse_data = load_sse_parser()
+    return [data async for data in iter_sse_data(FakeStreamReader(chunks))]
+
+
 # =============================================================================
 # Task 3.1: Constants and Manifest Tests
 # =============================================================================
@@ -163,6 +200,20 @@ class TestConstants:
             else:
                 os.environ.pop("CLARVIS_API_PORT", None)
 
+    @pytest.mark.parametrize("value", ["0", "-80", "80.5", ""])
+    def test_default_api_port_malformed_falls_back_to_default(self, value):
+        """Verify DEFAULT_API_PORT falls back to 8000 for malformed numbers."""
+        original = os.environ.get("CLARVIS_API_PORT")
+        try:
+            os.environ["CLARVIS_API_PORT"] = value
+            const = load_const_module()
+            assert const["DEFAULT_API_PORT"] == 8000
+        finally:
+            if original is not None:
+                os.environ["CLARVIS_API_PORT"] = original
+            else:
+                os.environ.pop("CLARVIS_API_PORT", None)
+
     def test_default_timeout(self):
         """Verify DEFAULT_TIMEOUT is reasonable."""
         const = load_const_module()
@@ -394,6 +445,18 @@ class TestHACommandDetection:
         result = any(keyword in query.lower() for keyword in ha_keywords)
         assert result == expected, f"Query '{query}' should return {expected}"
 
+    @pytest.mark.parametrize(
+        "query",
+        ["Turn On the lights", "DIM the lamp", "check my email", "tell me a joke"],
+    )
+    def test_ha_command_pattern_matches_keywords(self, query):
+        """Test the precompiled pattern agrees with the keyword list."""
+        const = load_const_module()
+        ha_keywords = const["HA_COMMAND_KEYWORDS"]
+
+        expected = any(keyword in query.lower() for keyword in ha_keywords)
+        assert (const["HA_COMMAND_PATTERN"].search(query) is not None) == expected
+
     def test_is_ha_command_case_insensitive(self):
         """Test HA command detection is case insensitive."""
         const = load_const_module()
@@ -530,6 +593,46 @@ class TestSessionManagement:
         assert "session_id" not in payload
 
 
+class TestSseParsing:
+    """Test suite for the SSE parser in conversation.py."""
+
+    async def test_single_line_events(self):
+        """Test that each event yields its data payload."""
+        body = b'data: {"text": "Hi"}\n\ndata: [DONE]\n\n'
+
+        assert await collect_sse_data([body]) == [b'{"text": "Hi"}', b"[DONE]"]
+
+    async def test_event_split_across_chunks(self):
+        """Test that lines split between chunks are reassembled."""
+        chunks = [b'data: {"te', b'xt": "Hel', b'lo"}\n', b"\ndata: [DO", b"NE]\n\n"]
+
+        assert await collect_sse_data(chunks) == [b'{"text": "Hello"}', b"[DONE]"]
+
+    async def test_crlf_line_endings(self):
+        """Test that CRLF line endings, even split between chunks, are handled."""
+        chunks = [b'data: {"text": "Hi"}\r', b"\n\r\ndata: [DONE]\r\n\r\n"]
+
+        assert await collect_sse_data(chunks) == [b'{"text": "Hi"}', b"[DONE]"]
+
+    async def test_multi_line_data_joined(self):
+        """Test that the data lines of one event are joined with newlines."""
+        body = b'data: {"text":\ndata: "Hi"}\n\ndata: [DONE]\n\n'
+
+        assert await collect_sse_data([body]) == [b'{"text":\n"Hi"}', b"[DONE]"]
+
+    async def test_final_event_without_trailing_newline(self):
+        """Test that a last event cut off before its newline is still yielded."""
+        body = b'data: {"text": "Hi"}\n\ndata: [DONE]'
+
+        assert await collect_sse_data([body]) == [b'{"text": "Hi"}', b"[DONE]"]
+
+    async def test_non_data_lines_ignored(self):
+        """Test that comments and other fields are skipped."""
+        body = b": keep-alive\nevent: message\ndata:[DONE]\n\n"
+
+        assert await collect_sse_data([body]) == [b"[DONE]"]
+
+
 # =============================================================================
 # Task 3.4: Component Setup Tests
 # =============================================================================
@@ -1,5 +1,7 @@
 """Tests for IntentClassifier and ClassificationResult (Issue #18)."""
 
+from unittest.mock import patch
+
 import pytest
 
 from clarvis_agents.orchestrator import (
@@ -169,6 +171,22 @@ class TestIntentClassifier:
         results = classifier._match_keywords("use the emailer tool")
         assert "email" not in results["gmail"][1]
 
+    def test_keyword_matching_counts_repeats_once(self):
+        """Test that a repeated keyword only scores once."""
+        classifier = IntentClassifier()
+        results = classifier._match_keywords("email email EMAIL")
+
+        score, keywords = results["gmail"]
+        assert keywords == ["email"]
+        assert score == pytest.approx(0.2)
+
+    def test_keyword_matching_prefers_longest_keyword(self):
+        """Test that overlapping keywords match the longer form."""
+        classifier = IntentClassifier()
+        results = classifier._match_keywords("any new emails?")
+
+        assert results["gmail"][1] == ["emails"]
+
     # Pattern matching tests
     def test_pattern_matching_single_pattern(self):
         """Test matching a single pattern."""
@@ -199,6 +217,48 @@ class TestIntentClassifier:
         score, _ = results["gmail"]
         assert score <= 0.6
 
+    def test_pattern_matching_no_match_returns_zero_scores(self):
+        """Test that queries matching no pattern score zero for every agent."""
+        classifier = IntentClassifier()
+        assert classifier._has_pattern_match("hello there") is False
+
+        results = classifier._match_patterns("hello there")
+
+        assert set(results) == set(classifier.AGENT_PATTERNS)
+        assert all(result == (0.0, []) for result in results.values())
+
+    def test_keyword_prefilter_skips_queries_without_keyword_tokens(self):
+        """Test that the token pre-filter only rejects keyword-free queries."""
+        classifier = IntentClassifier()
+
+        assert classifier._may_match_keywords("ok thanks") is False
+        assert classifier._may_match_keywords("check my email") is True
+        assert classifier._may_match_keywords("add milk to my to-do") is True
+
+        results = classifier._match_keywords("ok thanks")
+        assert all(result == (0.0, []) for result in results.values())
+
+    def test_classify_pattern_only_query_bypasses_prefilter(self):
+        """Test that pattern matches still count when no keyword token is present."""
+        classifier = IntentClassifier()
+        result = classifier.classify("remind me later")
+
+        assert result.agent_name == "notes"
+        assert result.matched_keywords == []
+
+    def test_classify_scans_union_pattern_once(self):
+        """Test that the full pattern pass doesn't repeat the union-pattern scan."""
+        classifier = IntentClassifier()
+        with patch.object(
+            classifier, "_has_pattern_match", wraps=classifier._has_pattern_match
+        ) as has_match, patch.object(
+            classifier, "_match_patterns", wraps=classifier._match_patterns
+        ) as match_patterns:
+            classifier.classify("check my unread email from john")
+
+        match_patterns.assert_called_once()
+        has_match.assert_called_once()
+
     def test_pattern_matching_case_insensitive(self):
         """Test that pattern matching is case insensitive."""
         classifier = IntentClassifier()
@@ -325,6 +385,62 @@ class TestIntentClassifier:
         assert result_high.agent_name == "gmail"
         assert result_high.needs_llm_routing is True
 
+    def test_classify_saturated_keywords_skips_other_patterns(self):
+        """Test that a decisive keyword winner only runs its own patterns."""
+        classifier = IntentClassifier()
+        keyword_results = classifier._match_keywords("check my unread emails in inbox")
+
+        results = classifier._match_patterns_saturated(
+            "check my unread emails in inbox", keyword_results
+        )
+
+        assert results is not None
+        assert list(results) == ["gmail"]
+        assert results["gmail"][0] > 0
+
+    def test_classify_saturated_keywords_without_patterns_scans_all(self):
+        """Test that a winner without pattern matches falls back to a full scan."""
+        classifier = IntentClassifier()
+        keyword_results = classifier._match_keywords("gmail inbox unread")
+
+        results = classifier._match_patterns_saturated(
+            "gmail inbox unread", keyword_results
+        )
+
+        assert results is None
+
+
+class TestIntentClassifierCache:
+    """Test suite for IntentClassifier result caching."""
+
+    def test_classify_caches_normalized_query(self):
+        """Test that case and surrounding whitespace share a cache entry."""
+        classifier = IntentClassifier()
+
+        first = classifier.classify("Check my unread emails")
+        second = classifier.classify("  check my UNREAD emails ")
+
+        assert first == second
+        assert classifier._classify_cached.cache_info().hits == 1
+
+    def test_classify_returns_independent_lists(self):
+        """Test that mutating a result does not corrupt the cache."""
+        classifier = IntentClassifier()
+
+        first = classifier.classify("check my unread emails")
+        first.matched_keywords.append("bogus")
+        second = classifier.classify("check my unread emails")
+
+        assert "bogus" not in second.matched_keywords
+
+    def test_classify_cache_respects_threshold_changes(self):
+        """Test that changing the threshold is not masked by the cache."""
+        classifier = IntentClassifier(threshold=0.2)
+        assert classifier.classify("email").needs_llm_routing is False
+
+        classifier.threshold = 0.5
+        assert classifier.classify("email").needs_llm_routing is True
+
 
 class TestIntentClassifierEdgeCases:
     """Additional edge case tests for IntentClassifier."""
@@ -1,8 +1,11 @@
 """Tests for OrchestratorAgent and OrchestratorConfig (Issue #18)."""
 
+import asyncio
+import gc
 import json
 import tempfile
-from datetime import datetime, timedelta
+import time
+import weakref
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -22,6 +25,12 @@ from clarvis_agents.orchestrator import (
     create_orchestrator,
     load_config,
 )
+from clarvis_agents.orchestrator.agent import _get_shared_client, _shared_clients
+
+
+def _mock_async_anthropic(**_):
+    """Build a stand-in AsyncAnthropic that, like a used pool, holds its loop."""
+    return MagicMock(close=AsyncMock(), loop=asyncio.get_running_loop())
 
 
 class MockAgent(BaseAgent):
@@ -228,6 +237,97 @@ class TestOrchestratorConfig:
         assert isinstance(config, OrchestratorConfig)
         assert config.model is not None
 
+    def test_load_config_is_cached(self):
+        """Test that load_config reuses the cached config until it is cleared."""
+        OrchestratorConfig.clear_cache()
+        try:
+            first = load_config()
+            assert load_config() is first
+            OrchestratorConfig.clear_cache()
+            assert load_config() is not first
+        finally:
+            OrchestratorConfig.clear_cache()
+
+    def test_load_config_picks_up_file_changes(self, tmp_path):
+        """Test that load_config re-reads the default file after it changes."""
+        config_path = tmp_path / "orchestrator_config.json"
+        config_path.write_text(json.dumps({"model": "first-model"}))
+
+        with patch.object(
+            OrchestratorConfig, "default_config_path", return_value=config_path
+        ):
+            try:
+                assert load_config().model == "first-model"
+                config_path.write_text(json.dumps({"model": "second-model-longer"}))
+                assert load_config().model == "second-model-longer"
+            finally:
+                OrchestratorConfig.clear_cache()
+
+    def test_cached_config_mappings_are_read_only(self, tmp_path):
+        """Test that a cached config cannot be changed through its mappings."""
+        config_path = tmp_path / "orchestrator_config.json"
+        config_path.write_text(
+            json.dumps({"agents": {"gmail": {"enabled": True, "priority": 1}}})
+        )
+
+        try:
+            config = OrchestratorConfig.from_file(config_path)
+            with pytest.raises(TypeError):
+                config.enabled_agents["ski"] = True
+            with pytest.raises(TypeError):
+                config.agent_priorities["gmail"] = 5
+            assert OrchestratorConfig.from_file(config_path).enabled_agents == {
+                "gmail": True
+            }
+        finally:
+            OrchestratorConfig.clear_cache()
+
+    def test_from_file_without_orjson(self):
+        """Test that from_file falls back to the stdlib json parser."""
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".json", delete=False
+        ) as f:
+            json.dump({"model": "stdlib-model"}, f)
+            temp_path = Path(f.name)
+
+        try:
+            with patch("clarvis_agents.orchestrator.config.HAS_ORJSON", False):
+                config = OrchestratorConfig.from_file(temp_path)
+            assert config.model == "stdlib-model"
+        finally:
+            temp_path.unlink()
+            OrchestratorConfig.clear_cache()
+
+    def test_from_file_caches_until_file_changes(self):
+        """Test that from_file reuses the parsed config until the file changes."""
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".json", delete=False
+        ) as f:
+            json.dump({"model": "first-model"}, f)
+            temp_path = Path(f.name)
+
+        try:
+            first = OrchestratorConfig.from_file(temp_path)
+            assert OrchestratorConfig.from_file(temp_path) is first
+
+            temp_path.write_text(json.dumps({"model": "second-model-longer"}))
+            second = OrchestratorConfig.from_file(temp_path)
+            assert second.model == "second-model-longer"
+
+            OrchestratorConfig.clear_cache()
+            assert OrchestratorConfig.from_file(temp_path) is not second
+        finally:
+            temp_path.unlink()
+            OrchestratorConfig.clear_cache()
+
+    def test_config_is_frozen(self):
+        """Test that config instances cannot be mutated."""
+        from dataclasses import FrozenInstanceError
+
+        config = OrchestratorConfig()
+        with pytest.raises(FrozenInstanceError):
+            config.model = "other-model"
+
     def test_from_file_nested_structure(self):
         """Test that from_file correctly parses nested JSON structure."""
         with tempfile.NamedTemporaryFile(
@@ -449,6 +549,19 @@ class TestOrchestratorAgentInit:
             assert isinstance(cap.keywords, list)
             assert isinstance(cap.examples, list)
 
+    def test_capabilities_returns_fresh_list(self):
+        """Test capabilities are shared but each call returns a new list."""
+        registry = AgentRegistry()
+        config = OrchestratorConfig()
+        orchestrator = OrchestratorAgent(config, registry)
+
+        first = orchestrator.capabilities
+        first.clear()
+        second = orchestrator.capabilities
+
+        assert len(second) >= 1
+        assert second[0] is orchestrator.capabilities[0]
+
     def test_health_check_with_healthy_agents(self):
         """Test health_check returns True with healthy agents."""
         registry = AgentRegistry()
@@ -534,9 +647,7 @@ class TestSessionManagement:
         context = orchestrator.get_or_create_session("old-session")
 
         # Manually expire the session
-        orchestrator._session_timestamps["old-session"] = datetime.now() - timedelta(
-            minutes=5
-        )
+        orchestrator._sessions["old-session"].expires_at = time.monotonic() - 60
 
         # Trigger cleanup by creating new session
         orchestrator.get_or_create_session("new-session")
@@ -551,16 +662,14 @@ class TestSessionManagement:
 
         # Create session
         orchestrator.get_or_create_session("test-session")
-        initial_timestamp = orchestrator._session_timestamps["test-session"]
+        initial_timestamp = orchestrator._sessions["test-session"].expires_at
 
         # Small delay to ensure timestamp difference
-        import time
-
         time.sleep(0.01)
 
         # Access session again
         orchestrator.get_or_create_session("test-session")
-        updated_timestamp = orchestrator._session_timestamps["test-session"]
+        updated_timestamp = orchestrator._sessions["test-session"].expires_at
 
         assert updated_timestamp >= initial_timestamp
 
@@ -585,7 +694,7 @@ class TestHandlerMethods:
         mock_client = MagicMock()
         mock_response = MagicMock()
         mock_response.content = [MagicMock(text="Hello! How can I help?")]
-        mock_client.messages.create.return_value = mock_response
+        mock_client.messages.create = AsyncMock(return_value=mock_response)
 
         orchestrator = OrchestratorAgent(
             config, registry, anthropic_client=mock_client
@@ -608,7 +717,7 @@ class TestHandlerMethods:
         mock_client = MagicMock()
         mock_response = MagicMock()
         mock_response.content = [MagicMock(text="Response")]
-        mock_client.messages.create.return_value = mock_response
+        mock_client.messages.create = AsyncMock(return_value=mock_response)
 
         orchestrator = OrchestratorAgent(
             config, registry, anthropic_client=mock_client
@@ -632,7 +741,7 @@ class TestHandlerMethods:
         config = OrchestratorConfig()
 
         mock_client = MagicMock()
-        mock_client.messages.create.side_effect = RuntimeError("API Error")
+        mock_client.messages.create = AsyncMock(side_effect=RuntimeError("API Error"))
 
         orchestrator = OrchestratorAgent(
             config, registry, anthropic_client=mock_client
@@ -750,6 +859,23 @@ class TestHandlerMethods:
         assert response.success is True
         assert "rephras" in response.content.lower()
 
+    @pytest.mark.asyncio
+    async def test_handle_fallback_refreshes_after_registry_change(self):
+        """Test cached fallback text is rebuilt when agents change."""
+        registry = AgentRegistry()
+        registry.register(MockAgent("gmail"))
+        orchestrator = OrchestratorAgent(OrchestratorConfig(), registry)
+        context = ConversationContext()
+
+        first = await orchestrator._handle_fallback("unknown query", context)
+        again = await orchestrator._handle_fallback("unknown query", context)
+        registry.register(MockAgent("ski"))
+        updated = await orchestrator._handle_fallback("unknown query", context)
+
+        assert first.content is again.content
+        assert "ski" not in first.content
+        assert "ski" in updated.content
+
 
 class TestProcessMethod:
     """Test suite for process() method."""
@@ -770,7 +896,7 @@ class TestProcessMethod:
         mock_client = MagicMock()
         mock_response = MagicMock()
         mock_response.content = [MagicMock(text="Hello!")]
-        mock_client.messages.create.return_value = mock_response
+        mock_client.messages.create = AsyncMock(return_value=mock_response)
 
         orchestrator = OrchestratorAgent(
             config, registry, anthropic_client=mock_client
@@ -806,7 +932,7 @@ class TestProcessMethod:
         mock_client = MagicMock()
         mock_response = MagicMock()
         mock_response.content = [MagicMock(text="Response")]
-        mock_client.messages.create.return_value = mock_response
+        mock_client.messages.create = AsyncMock(return_value=mock_response)
 
         orchestrator = OrchestratorAgent(
             config, registry, anthropic_client=mock_client
@@ -847,7 +973,7 @@ class TestProcessMethod:
         mock_client = MagicMock()
         mock_response = MagicMock()
         mock_response.content = [MagicMock(text="Response")]
-        mock_client.messages.create.return_value = mock_response
+        mock_client.messages.create = AsyncMock(return_value=mock_response)
 
         orchestrator = OrchestratorAgent(
             config, registry, anthropic_client=mock_client
@@ -859,9 +985,229 @@ class TestProcessMethod:
 
         # Second call uses same session
         await orchestrator.process("hi again", session_id="my-session")
-        context = orchestrator._sessions["my-session"]
+        context = orchestrator._sessions["my-session"].context
         assert len(context.turns) == 2
 
+    @pytest.mark.asyncio
+    async def test_process_greeting_uses_direct_response(self):
+        """Test greeting is answered by the direct handler exactly once."""
+        registry = AgentRegistry()
+        config = OrchestratorConfig()
+        orchestrator = OrchestratorAgent(config, registry)
+
+        direct_response = AgentResponse(
+            content="Hi there!",
+            success=True,
+            agent_name="orchestrator",
+            metadata={"handled_directly": True},
+        )
+        orchestrator._handle_direct = AsyncMock(return_value=direct_response)
+
+        response = await orchestrator.process("hello")
+
+        assert response is direct_response
+        orchestrator._handle_direct.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_process_greeting_prefix_routes_to_agent(self):
+        """Test a query opening with a greeting still goes to the routed agent."""
+        registry = AgentRegistry()
+        registry.register(MockAgent("gmail"))
+        config = OrchestratorConfig()
+        orchestrator = OrchestratorAgent(config, registry)
+
+        orchestrator._handle_direct = AsyncMock()
+        orchestrator._router = AsyncMock()
+        orchestrator._router.route.return_value = RoutingDecision(
+            agent_name="gmail", confidence=0.9, reasoning="test"
+        )
+
+        response = await orchestrator.process("hey check email")
+
+        assert response.agent_name == "gmail"
+        assert response.content == "Mock response to: hey check email"
+
+    @pytest.mark.asyncio
+    async def test_process_non_greeting_skips_direct(self):
+        """Test non-greeting queries are not handled directly."""
+        registry = AgentRegistry()
+        registry.register(MockAgent("gmail"))
+        config = OrchestratorConfig(llm_routing_enabled=False)
+        orchestrator = OrchestratorAgent(config, registry)
+        orchestrator._handle_direct = AsyncMock()
+
+        await orchestrator.process("check my emails")
+
+        orchestrator._handle_direct.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_process_surfaces_router_error(self):
+        """Test router errors are reported in the error response."""
+        registry = AgentRegistry()
+        config = OrchestratorConfig()
+        orchestrator = OrchestratorAgent(config, registry)
+
+        orchestrator._handle_direct = AsyncMock()
+        orchestrator._router = AsyncMock()
+        orchestrator._router.route.side_effect = RuntimeError("Router error")
+
+        response = await orchestrator.process("hello")
+
+        assert response.success is False
+        assert response.error == "Router error"
+
+
+class TestStreamMethod:
+    """Test suite for stream() method."""
+
+    @pytest.fixture(autouse=True)
+    def reset_registry(self):
+        """Reset registry between tests."""
+        AgentRegistry.reset_instance()
+        yield
+        AgentRegistry.reset_instance()
+
+    @pytest.mark.asyncio
+    async def test_stream_records_joined_response(self):
+        """Test stream stores the concatenated chunks as the turn response."""
+        registry = AgentRegistry()
+        registry.register(MockAgent("gmail"))
+        config = OrchestratorConfig(llm_routing_enabled=False)
+        orchestrator = OrchestratorAgent(config, registry)
+        context = ConversationContext()
+
+        chunks = [
+            chunk
+            async for chunk in orchestrator.stream("check my emails", context=context)
+        ]
+
+        assert len(chunks) == 2  # routing announcement + agent response
+        assert context.turns[0].response == "".join(chunks)
+        assert context.last_agent == "gmail"
+
+    @pytest.mark.asyncio
+    async def test_stream_prefetches_before_announcement(self):
+        """Test the routed agent can start loading before the announcement."""
+        registry = AgentRegistry()
+        agent = MockAgent("gmail")
+        agent.prefetch = MagicMock()
+        registry.register(agent)
+        config = OrchestratorConfig(llm_routing_enabled=False)
+        orchestrator = OrchestratorAgent(config, registry)
+
+        stream = orchestrator.stream("check my emails", context=ConversationContext())
+        announcement = await stream.__anext__()
+        await stream.aclose()
+
+        assert announcement == "Checking your email. "
+        agent.prefetch.assert_called_once_with("check my emails")
+
+    @pytest.mark.asyncio
+    async def test_stream_direct_uses_async_client(self):
+        """Test direct streaming consumes the async client's text stream."""
+
+        async def text_stream():
+            for text in ["Hello", " there!"]:
+                yield text
+
+        stream = MagicMock()
+        stream.text_stream = text_stream()
+        stream_manager = MagicMock()
+        stream_manager.__aenter__ = AsyncMock(return_value=stream)
+        stream_manager.__aexit__ = AsyncMock(return_value=None)
+        mock_client = MagicMock()
+        mock_client.messages.stream.return_value = stream_manager
+
+        registry = AgentRegistry()
+        config = OrchestratorConfig()
+        orchestrator = OrchestratorAgent(
+            config, registry, anthropic_client=mock_client
+        )
+
+        chunks = [
+            chunk
+            async for chunk in orchestrator._stream_direct(
+                "hello", ConversationContext()
+            )
+        ]
+
+        assert chunks == ["Hello", " there!"]
+
+
+class TestBatchMethods:
+    """Test suite for batch_process() and batch_stream()."""
+
+    @pytest.fixture(autouse=True)
+    def reset_registry(self):
+        """Reset registry between tests."""
+        AgentRegistry.reset_instance()
+        yield
+        AgentRegistry.reset_instance()
+
+    @pytest.mark.asyncio
+    async def test_batch_process_preserves_order(self):
+        """Test batch_process returns responses in query order."""
+        registry = AgentRegistry()
+        registry.register(MockAgent("gmail"))
+        registry.register(MockAgent("ski"))
+        config = OrchestratorConfig(llm_routing_enabled=False)
+        orchestrator = OrchestratorAgent(config, registry)
+
+        responses = await orchestrator.batch_process(
+            [("check my emails", None), ("what's the ski report at meadows", None)]
+        )
+
+        assert [r.agent_name for r in responses] == ["gmail", "ski"]
+
+    @pytest.mark.asyncio
+    async def test_batch_process_shared_session_runs_in_order(self):
+        """Test queries sharing a session are applied in submission order."""
+        registry = AgentRegistry()
+        registry.register(MockAgent("gmail"))
+        config = OrchestratorConfig(llm_routing_enabled=False)
+        orchestrator = OrchestratorAgent(config, registry)
+
+        await orchestrator.batch_process(
+            [
+                ("check my emails", "shared"),
+                ("check my unread emails", "shared"),
+            ]
+        )
+
+        context = orchestrator._sessions["shared"].context
+        assert [t.query for t in context.turns] == [
+            "check my emails",
+            "check my unread emails",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batch_process_rejects_invalid_concurrency(self):
+        """Test batch_process validates max_concurrency."""
+        orchestrator = OrchestratorAgent(OrchestratorConfig(), AgentRegistry())
+
+        with pytest.raises(ValueError):
+            await orchestrator.batch_process([("hello", None)], max_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_batch_stream_tags_chunks_with_index(self):
+        """Test batch_stream yields every chunk tagged with its query index."""
+        registry = AgentRegistry()
+        registry.register(MockAgent("gmail"))
+        registry.register(MockAgent("ski"))
+        config = OrchestratorConfig(llm_routing_enabled=False)
+        orchestrator = OrchestratorAgent(config, registry)
+
+        collected: dict[int, list[str]] = {0: [], 1: []}
+        async for index, chunk in orchestrator.batch_stream(
+            [("check my emails", None), ("what's the ski report at meadows", None)]
+        ):
+            collected[index].append(chunk)
+
+        assert "".join(collected[0]).endswith("Mock response to: check my emails")
+        assert "".join(collected[1]).endswith(
+            "Mock response to: what's the ski report at meadows"
+        )
+
 
 class TestCreateOrchestrator:
     """Test suite for create_orchestrator factory."""
@@ -915,10 +1261,10 @@ class TestOrchestratorAgentEdgeCases:
             orchestrator.get_or_create_session(f"session-{i}")
 
         # Expire some sessions
-        now = datetime.now()
-        orchestrator._session_timestamps["session-0"] = now - timedelta(minutes=5)
-        orchestrator._session_timestamps["session-1"] = now - timedelta(minutes=5)
-        orchestrator._session_timestamps["session-2"] = now - timedelta(minutes=5)
+        now = time.monotonic()
+        orchestrator._sessions["session-0"].expires_at = now - 60
+        orchestrator._sessions["session-1"].expires_at = now - 60
+        orchestrator._sessions["session-2"].expires_at = now - 60
         # session-3 and session-4 remain active
 
         # Trigger cleanup
@@ -931,15 +1277,16 @@ class TestOrchestratorAgentEdgeCases:
         assert "session-3" in orchestrator._sessions
         assert "session-4" in orchestrator._sessions
 
-    def test_get_client_caches_instance(self):
+    @pytest.mark.asyncio
+    async def test_get_client_caches_instance(self):
         """Test that _get_client caches the Anthropic client."""
         registry = AgentRegistry()
         config = OrchestratorConfig()
         orchestrator = OrchestratorAgent(config, registry)
 
         with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-            with patch("clarvis_agents.orchestrator.agent.Anthropic") as mock_anthropic:
-                mock_client = MagicMock()
+            with patch("anthropic.AsyncAnthropic") as mock_anthropic:
+                mock_client = MagicMock(close=AsyncMock())
                 mock_anthropic.return_value = mock_client
 
                 client1 = orchestrator._get_client()
@@ -949,6 +1296,82 @@ class TestOrchestratorAgentEdgeCases:
                 assert mock_anthropic.call_count == 1
                 assert client1 is client2
 
+    @pytest.mark.asyncio
+    async def test_get_client_shared_across_orchestrators(self):
+        """Test that orchestrators with the same API key share one client."""
+        registry = AgentRegistry()
+        config = OrchestratorConfig()
+        first = OrchestratorAgent(config, registry)
+        second = OrchestratorAgent(config, registry)
+
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
+            with patch("anthropic.AsyncAnthropic") as mock_anthropic:
+                mock_anthropic.return_value = MagicMock(close=AsyncMock())
+
+                assert first._get_client() is second._get_client()
+                assert mock_anthropic.call_count == 1
+                http_client = mock_anthropic.call_args.kwargs["http_client"]
+                assert http_client is not None
+
+    def test_shared_client_per_event_loop(self):
+        """Test that each event loop gets its own shared client."""
+
+        async def get_client():
+            return _get_shared_client("test-key")
+
+        with patch("anthropic.AsyncAnthropic", side_effect=_mock_async_anthropic):
+            first = asyncio.run(get_client())
+            second = asyncio.run(get_client())
+
+        assert first is not second
+
+    def test_shared_clients_closed_at_loop_shutdown(self):
+        """Test that a loop's shared clients are closed and released at shutdown."""
+        open_loops = len(_shared_clients)
+        loops = []
+
+        async def get_client():
+            loops.append(weakref.ref(asyncio.get_running_loop()))
+            return _get_shared_client("test-key")
+
+        with patch("anthropic.AsyncAnthropic", side_effect=_mock_async_anthropic):
+            clients = [asyncio.run(get_client()) for _ in range(2)]
+
+        for client in clients:
+            client.close.assert_awaited_once()
+        assert len(_shared_clients) == open_loops
+
+        # Nothing but the test held the clients, and so their loops
+        del clients, client
+        gc.collect()
+        assert all(loop() is None for loop in loops)
+
+    def test_get_client_follows_event_loop(self):
+        """Test that one orchestrator uses the client of the current loop."""
+        registry = AgentRegistry()
+        config = OrchestratorConfig()
+        orchestrator = OrchestratorAgent(config, registry)
+
+        async def get_client():
+            return orchestrator._get_client()
+
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
+            with patch("anthropic.AsyncAnthropic", side_effect=_mock_async_anthropic):
+                first = asyncio.run(get_client())
+                second = asyncio.run(get_client())
+
+        assert first is not second
+        assert orchestrator._client is None
+
+    def test_get_client_uses_injected_client(self):
+        """Test that an injected client is used regardless of the loop."""
+        mock_client = MagicMock()
+        orchestrator = OrchestratorAgent(
+            OrchestratorConfig(), AgentRegistry(), anthropic_client=mock_client
+        )
+
+        assert orchestrator._get_client() is mock_client
+
 
 class TestSessionContinuity:
     """Test session continuity across multiple queries."""
@@ -969,7 +1392,7 @@ class TestSessionContinuity:
         mock_client = MagicMock()
         mock_response = MagicMock()
         mock_response.content = [MagicMock(text="Response")]
-        mock_client.messages.create.return_value = mock_response
+        mock_client.messages.create = AsyncMock(return_value=mock_response)
 
         orchestrator = OrchestratorAgent(
             config, registry, anthropic_client=mock_client
@@ -982,7 +1405,7 @@ class TestSessionContinuity:
         await orchestrator.process("hi again", session_id="test-session")
 
         # Verify context has both turns
-        context = orchestrator._sessions["test-session"]
+        context = orchestrator._sessions["test-session"].context
         assert len(context.turns) == 2
 
     @pytest.mark.asyncio
@@ -994,7 +1417,7 @@ class TestSessionContinuity:
         mock_client = MagicMock()
         mock_response = MagicMock()
         mock_response.content = [MagicMock(text="Response")]
-        mock_client.messages.create.return_value = mock_response
+        mock_client.messages.create = AsyncMock(return_value=mock_response)
 
         orchestrator = OrchestratorAgent(
             config, registry, anthropic_client=mock_client
@@ -1007,10 +1430,10 @@ class TestSessionContinuity:
         await orchestrator.process("hi", session_id="session-b")
 
         # Verify sessions are separate
-        assert len(orchestrator._sessions["session-a"].turns) == 1
-        assert len(orchestrator._sessions["session-b"].turns) == 1
-        assert orchestrator._sessions["session-a"].turns[0].query == "hello"
-        assert orchestrator._sessions["session-b"].turns[0].query == "hi"
+        assert len(orchestrator._sessions["session-a"].context.turns) == 1
+        assert len(orchestrator._sessions["session-b"].context.turns) == 1
+        assert orchestrator._sessions["session-a"].context.turns[0].query == "hello"
+        assert orchestrator._sessions["session-b"].context.turns[0].query == "hi"
 
 
 class TestModuleExports:
@@ -1039,6 +1462,25 @@ class TestModuleExports:
         assert "create_orchestrator" in orchestrator.__all__
         assert "load_config" in orchestrator.__all__
 
+    def test_import_does_not_load_anthropic(self):
+        """Test importing the orchestrator defers loading the Anthropic SDK."""
+        import subprocess
+        import sys
+
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, clarvis_agents.orchestrator; "
+                "assert 'anthropic' not in sys.modules",
+            ],
+            cwd=Path(__file__).parent.parent.parent,
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0, result.stderr
+
 
 class TestBaseAgentInterface:
     """Test suite for BaseAgent interface compliance."""
@@ -1075,7 +1517,7 @@ class TestBaseAgentInterface:
         mock_client = MagicMock()
         mock_response = MagicMock()
         mock_response.content = [MagicMock(text="Response")]
-        mock_client.messages.create.return_value = mock_response
+        mock_client.messages.create = AsyncMock(return_value=mock_response)
 
         orchestrator = OrchestratorAgent(
             config, registry, anthropic_client=mock_client
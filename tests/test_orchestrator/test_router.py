@@ -25,6 +25,7 @@ from clarvis_agents.orchestrator.prompts import (
     THANKS_PATTERNS,
     format_agent_descriptions,
 )
+from clarvis_agents.orchestrator.router import _get_anthropic_client
 
 
 class MockAgent(BaseAgent):
@@ -102,6 +103,14 @@ class TestRoutingDecision:
         assert decision.agent_name is None
         assert decision.handle_directly is False
 
+    def test_routing_decision_uses_slots(self):
+        """Test RoutingDecision instances carry no per-instance __dict__."""
+        decision = RoutingDecision(agent_name="gmail", confidence=0.9, reasoning="x")
+
+        assert not hasattr(decision, "__dict__")
+        with pytest.raises(AttributeError):
+            decision.extra = True
+
     def test_routing_decision_confidence_bounds(self):
         """Test confidence can be set to boundary values."""
         decision_zero = RoutingDecision(
@@ -138,6 +147,12 @@ class TestRouterPrompts:
         for phrase in expected:
             assert phrase in THANKS_PATTERNS
 
+    def test_direct_patterns_are_immutable_lowercase(self):
+        """Test the direct-handling phrase lists are lowercase tuples."""
+        for patterns in (GREETING_PATTERNS, THANKS_PATTERNS):
+            assert isinstance(patterns, tuple)
+            assert all(phrase == phrase.lower() for phrase in patterns)
+
     def test_format_agent_descriptions_empty(self):
         """Test format_agent_descriptions with empty dict."""
         result = format_agent_descriptions({})
@@ -248,6 +263,24 @@ class TestIntentRouterInit:
         assert router._client is mock_client
         assert router.client is mock_client
 
+    def test_client_shared_across_routers(self):
+        """Test that routers using the same API key share one client."""
+        registry = AgentRegistry()
+        config = OrchestratorConfig()
+        first = IntentRouter(registry, config)
+        second = IntentRouter(registry, config)
+
+        _get_anthropic_client.cache_clear()
+        try:
+            with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
+                with patch("anthropic.Anthropic") as mock_anthropic:
+                    mock_anthropic.return_value = MagicMock()
+
+                    assert first.client is second.client
+                    assert mock_anthropic.call_count == 1
+        finally:
+            _get_anthropic_client.cache_clear()
+
     def test_client_raises_error_when_api_key_missing(self):
         """Test that accessing client raises ValueError when API key not set."""
         registry = AgentRegistry()
@@ -328,6 +361,23 @@ class TestDirectHandling:
 
         assert result is None
 
+    def test_patterns_match_whole_words_only(self, router: IntentRouter):
+        """Test short patterns don't fire inside longer words."""
+        assert router._should_handle_directly("your calendar for today") is None
+        assert router._should_handle_directly("weather in the city") is None
+
+        result = router._should_handle_directly("  Hiya there")
+        assert result is not None
+        assert "'hiya'" in result.reasoning
+
+    def test_greeting_takes_priority_over_thanks(self, router: IntentRouter):
+        """Test a leading greeting is reported even when thanks follows."""
+        greeting = router._should_handle_directly("hi, thanks again")
+        thanks = router._should_handle_directly("well thanks, hi")
+
+        assert greeting.reasoning == "Greeting detected: 'hi'"
+        assert thanks.reasoning == "Thanks/acknowledgment detected: 'thanks'"
+
     def test_case_insensitive(self, router: IntentRouter):
         """Test greeting detection is case insensitive."""
         result_lower = router._should_handle_directly("hello")
@@ -455,6 +505,32 @@ class TestLLMRouting:
         mock_client = MagicMock()
         return IntentRouter(registry, config, anthropic_client=mock_client)
 
+    def test_system_prompt_cached_per_registry_version(self, router_with_mock_client):
+        """Test the router prompt is rebuilt only when agents change."""
+        router = router_with_mock_client
+
+        first = router._system_prompt()
+        assert router._system_prompt() is first
+        assert "gmail" in first
+
+        router.registry.register(MockAgent("weather", "Weather agent"))
+        updated = router._system_prompt()
+
+        assert updated is not first
+        assert "weather" in updated
+
+    def test_agent_names_cached_per_registry_version(self, router_with_mock_client):
+        """Test the valid agent names are rebuilt only when agents change."""
+        router = router_with_mock_client
+
+        first = router._agent_names()
+        assert router._agent_names() is first
+        assert first == {"gmail", "calendar"}
+
+        router.registry.unregister("calendar")
+
+        assert router._agent_names() == {"gmail"}
+
     def test_parse_llm_response_valid_format(self):
         """Test _parse_llm_response with valid format."""
         registry = AgentRegistry()
@@ -473,6 +549,73 @@ REASONING: Query is about email"""
         assert result.reasoning == "Query is about email"
         assert result.handle_directly is False
 
+    def test_parse_llm_response_json_format(self):
+        """Test _parse_llm_response with the JSON format from the prompt."""
+        registry = AgentRegistry()
+        registry.register(MockAgent("gmail"))
+        config = OrchestratorConfig()
+        router = IntentRouter(registry, config)
+
+        result = router._parse_llm_response(
+            '{"agent": "Gmail", "confidence": 1.5, "reasoning": "About email"}'
+        )
+        direct = router._parse_llm_response('{"agent": "DIRECT", "confidence": 0.9}')
+
+        assert result.agent_name == "gmail"
+        assert result.confidence == 1.0
+        assert result.reasoning == "About email"
+        assert result.handle_directly is False
+        assert direct.agent_name is None
+        assert direct.handle_directly is True
+
+    def test_parse_llm_response_fenced_json(self):
+        """Test a JSON reply wrapped in a markdown code fence."""
+        registry = AgentRegistry()
+        registry.register(MockAgent("gmail"))
+        config = OrchestratorConfig()
+        router = IntentRouter(registry, config)
+
+        result = router._parse_llm_response(
+            '```json\n{"agent": "gmail", "confidence": 0.8, "reasoning": "Email"}\n```'
+        )
+
+        assert result.agent_name == "gmail"
+        assert result.confidence == pytest.approx(0.8)
+        assert result.reasoning == "Email"
+        assert result.handle_directly is False
+
+    def test_parse_llm_response_json_with_preamble(self):
+        """Test a JSON reply preceded and followed by prose."""
+        registry = AgentRegistry()
+        registry.register(MockAgent("gmail"))
+        config = OrchestratorConfig()
+        router = IntentRouter(registry, config)
+
+        result = router._parse_llm_response(
+            'Here is my routing decision:\n{"agent": "DIRECT", "confidence": 0.7, '
+            '"reasoning": "A greeting"}\nLet me know if you need more.'
+        )
+
+        assert result.agent_name is None
+        assert result.handle_directly is True
+        assert result.confidence == pytest.approx(0.7)
+        assert result.reasoning == "A greeting"
+
+    def test_parse_llm_response_truncated_json(self):
+        """Test a JSON reply cut off before the closing brace."""
+        registry = AgentRegistry()
+        registry.register(MockAgent("gmail"))
+        config = OrchestratorConfig()
+        router = IntentRouter(registry, config)
+
+        result = router._parse_llm_response(
+            '{"agent": "gmail", "confidence": 0.9, "reasoning": "The user asks ab'
+        )
+
+        assert result.agent_name == "gmail"
+        assert result.confidence == pytest.approx(0.9)
+        assert result.reasoning == "The user asks ab"
+
     def test_parse_llm_response_direct(self):
         """Test _parse_llm_response with AGENT: DIRECT."""
         registry = AgentRegistry()
@@ -693,6 +836,55 @@ class TestRouteMethod:
         assert result.agent_name == "gmail"
         assert "follow-up" in result.reasoning.lower()
 
+    @pytest.mark.asyncio
+    async def test_repeated_queries_reuse_classification(self):
+        """Test that re-routing a query reuses the cached classification."""
+        registry = AgentRegistry()
+        registry.register(MockAgent("gmail", "Email agent"))
+        router = IntentRouter(registry, OrchestratorConfig(llm_routing_enabled=False))
+
+        first = await router.route("Check my unread emails")
+        second = await router.route("  check my UNREAD emails ")
+
+        assert first == second
+        assert router.classifier._classify_cached.cache_info().hits == 1
+
+    @pytest.mark.asyncio
+    async def test_code_routing_reason_detail_follows_logging_flag(self):
+        """Test keyword details are only formatted when decisions are logged."""
+        registry = AgentRegistry()
+        registry.register(MockAgent("gmail", "Email agent"))
+        query = "check my unread emails in inbox"
+
+        verbose = IntentRouter(registry, OrchestratorConfig())
+        terse = IntentRouter(
+            registry, OrchestratorConfig(log_routing_decisions=False)
+        )
+
+        verbose_result = await verbose.route(query)
+        terse_result = await terse.route(query)
+
+        assert verbose_result.agent_name == terse_result.agent_name == "gmail"
+        assert "matched keywords" in verbose_result.reasoning
+        assert terse_result.reasoning == "Code-based routing"
+
+    @pytest.mark.asyncio
+    async def test_thanks_takes_priority_over_follow_up(
+        self, router_with_agents: IntentRouter
+    ):
+        """Test that thanks is handled directly even mid-conversation."""
+        context = ConversationContext()
+        context.add_turn(
+            query="check my emails",
+            response="You have 3 unread emails",
+            agent="gmail",
+        )
+
+        result = await router_with_agents.route("thanks, that's it", context)
+
+        assert result.handle_directly is True
+        assert result.agent_name is None
+
     @pytest.mark.asyncio
     async def test_greetings_handled_directly(self, router_with_agents: IntentRouter):
         """Test that greetings are handled directly."""
@@ -782,6 +974,20 @@ REASONING: test"""
         # Should use default confidence
         assert result.confidence == 0.5
 
+    def test_parse_llm_response_tolerates_spacing(self):
+        """Test fields parse with spaces before the colon and CRLF endings."""
+        registry = AgentRegistry()
+        registry.register(MockAgent("gmail"))
+        config = OrchestratorConfig()
+        router = IntentRouter(registry, config)
+
+        response_text = "  Agent : Gmail\r\nconfidence:0.8  \r\nREASONING :\r\n"
+        result = router._parse_llm_response(response_text)
+
+        assert result.agent_name == "gmail"
+        assert result.confidence == pytest.approx(0.8)
+        assert result.reasoning == ""
+
     def test_parse_llm_response_missing_newlines(self):
         """Test _parse_llm_response with single-line response."""
         registry = AgentRegistry()
@@ -1,9 +1,15 @@
 """Tests for Ski Agent."""
 
+import asyncio
+import logging
 import pytest
+from datetime import datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import patch, AsyncMock, MagicMock
 
 from clarvis_agents.ski_agent import SkiAgent, create_ski_agent, SkiAgentConfig
+from clarvis_agents.ski_agent import agent as ski_agent_module
+from clarvis_agents.ski_agent.tools import STALE_PREFIX
 from clarvis_agents.core import (
     AgentCapability,
     AgentRegistry,
@@ -33,6 +39,47 @@ class TestSkiAgent:
         agent = SkiAgent(config, client=mock_anthropic_client)
         assert agent.config.max_turns == 20
 
+    @pytest.fixture
+    def log_dir(self, tmp_path):
+        """Log directory whose file handlers are removed and closed afterwards."""
+        yield tmp_path
+        for handler in self._file_handlers(tmp_path):
+            ski_agent_module.logger.removeHandler(handler)
+            handler.close()
+
+    @staticmethod
+    def _file_handlers(log_dir):
+        """File handlers on the ski agent logger that write into log_dir."""
+        return [
+            handler
+            for handler in ski_agent_module.logger.handlers
+            if isinstance(handler, logging.FileHandler)
+            and handler.baseFilename.startswith(str(log_dir))
+        ]
+
+    def test_log_file_handler_added_once(self, mock_anthropic_client, log_dir):
+        """Test that recreating the agent doesn't duplicate its log handler."""
+        config = SkiAgentConfig(log_dir=log_dir)
+        SkiAgent(config, client=mock_anthropic_client)
+        SkiAgent(config, client=mock_anthropic_client)
+
+        assert len(self._file_handlers(log_dir)) == 1
+
+    def test_log_file_handler_moves_to_new_day(self, mock_anthropic_client, log_dir):
+        """Test that an agent made on a later day replaces the old day's handler."""
+        config = SkiAgentConfig(log_dir=log_dir)
+        SkiAgent(config, client=mock_anthropic_client)
+        [old_handler] = self._file_handlers(log_dir)
+
+        tomorrow = datetime.now() + timedelta(days=1)
+        with patch.object(ski_agent_module, "datetime") as mock_datetime:
+            mock_datetime.now.return_value = tomorrow
+            SkiAgent(config, client=mock_anthropic_client)
+
+        [handler] = self._file_handlers(log_dir)
+        assert handler.baseFilename.endswith(f"access_{tomorrow:%Y%m%d}.log")
+        assert old_handler.stream is None
+
 
 class TestSkiAgentBaseAgent:
     """Test suite for SkiAgent BaseAgent interface implementation."""
@@ -195,6 +242,151 @@ class TestSkiAgentRateLimiting:
         assert any("Rate limit exceeded" in r for r in results2)
 
 
+class TestSkiAgentCaching:
+    """Test suite for Ski Agent conditions caching."""
+
+    @pytest.mark.asyncio
+    async def test_conditions_fetched_once_within_ttl(self, mock_anthropic_client):
+        """Test that repeated lookups within the TTL reuse the cached data."""
+        agent = SkiAgent(client=mock_anthropic_client)
+
+        with patch("clarvis_agents.ski_agent.agent.fetch_ski_conditions_impl", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = "mock conditions"
+
+            first = await agent._get_cached_conditions()
+            second = await agent._get_cached_conditions()
+
+        assert first == second == "mock conditions"
+        mock_fetch.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_expired_cache_refetches(self, mock_anthropic_client):
+        """Test that an expired cache entry triggers a new fetch."""
+        config = SkiAgentConfig(cache_ttl_minutes=0)
+        agent = SkiAgent(config, client=mock_anthropic_client)
+
+        with patch("clarvis_agents.ski_agent.agent.fetch_ski_conditions_impl", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.side_effect = ["old conditions", "new conditions"]
+
+            await agent._get_cached_conditions()
+            agent._cache.timestamp -= timedelta(seconds=1)
+            result = await agent._get_cached_conditions()
+
+        assert result == "new conditions"
+        assert mock_fetch.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_served_while_refreshing(self, mock_anthropic_client):
+        """Test that data within twice the TTL is served while it refreshes."""
+        agent = SkiAgent(client=mock_anthropic_client)
+
+        with patch("clarvis_agents.ski_agent.agent.fetch_ski_conditions_impl", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.side_effect = ["old conditions", "new conditions"]
+
+            await agent._get_cached_conditions()
+            agent._cache.timestamp -= timedelta(minutes=20)
+            stale = await agent._get_cached_conditions()
+            await agent._inflight
+            fresh = await agent._get_cached_conditions()
+
+        assert stale == "old conditions"
+        assert fresh == "new conditions"
+        assert mock_fetch.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_prefetch_fills_cache(self, mock_anthropic_client):
+        """Test that prefetch starts a fetch the next lookup reuses."""
+        agent = SkiAgent(client=mock_anthropic_client)
+
+        with patch("clarvis_agents.ski_agent.agent.fetch_ski_conditions_impl", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = "mock conditions"
+
+            agent.prefetch("What's the ski report?")
+            agent.prefetch("What's the ski report?")
+            result = await agent._get_cached_conditions()
+
+        assert result == "mock conditions"
+        mock_fetch.assert_called_once()
+
+    def test_prefetch_without_event_loop_is_noop(self, mock_anthropic_client):
+        """Test that prefetch does nothing outside an event loop."""
+        agent = SkiAgent(client=mock_anthropic_client)
+
+        agent.prefetch("What's the ski report?")
+
+        assert agent._inflight is None
+
+    @pytest.mark.asyncio
+    async def test_fetch_errors_not_cached(self, mock_anthropic_client):
+        """Test that error text from a failed fetch is not cached."""
+        agent = SkiAgent(client=mock_anthropic_client)
+
+        with patch("clarvis_agents.ski_agent.agent.fetch_ski_conditions_impl", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.side_effect = ["Error: Request timed out.", "mock conditions"]
+
+            await agent._get_cached_conditions()
+            result = await agent._get_cached_conditions()
+
+        assert result == "mock conditions"
+        assert mock_fetch.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_fetch_results_not_cached(self, mock_anthropic_client):
+        """Test that text served stale after a failed fetch is not cached."""
+        agent = SkiAgent(client=mock_anthropic_client)
+        stale = f"{STALE_PREFIX} fetched 20 minutes ago.\n\nold conditions"
+
+        with patch("clarvis_agents.ski_agent.agent.fetch_ski_conditions_impl", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.side_effect = [stale, "mock conditions"]
+
+            first = await agent._get_cached_conditions()
+            second = await agent._get_cached_conditions()
+
+        assert first == stale
+        assert second == "mock conditions"
+        assert mock_fetch.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self, mock_anthropic_client):
+        """Test that concurrent cache misses wait on the same fetch."""
+        agent = SkiAgent(client=mock_anthropic_client)
+
+        async def slow_fetch():
+            await asyncio.sleep(0.01)
+            return "Error: Request timed out."
+
+        with patch("clarvis_agents.ski_agent.agent.fetch_ski_conditions_impl", side_effect=slow_fetch) as mock_fetch:
+            results = await asyncio.gather(
+                *(agent._get_cached_conditions() for _ in range(3))
+            )
+
+        assert results == ["Error: Request timed out."] * 3
+        mock_fetch.assert_called_once()
+        assert agent._inflight is None
+
+
+class TestSkiAgentResponseText:
+    """Test suite for Ski Agent response text assembly."""
+
+    @pytest.mark.asyncio
+    async def test_get_conditions_joins_text_blocks(self, mock_anthropic_client):
+        """Test that only text blocks contribute to the response."""
+        agent = SkiAgent(client=mock_anthropic_client)
+        mock_anthropic_client.messages.create.return_value = SimpleNamespace(
+            content=[
+                SimpleNamespace(type="text", text="72 inches at the base. "),
+                SimpleNamespace(type="tool_use", id="tool_1"),
+                SimpleNamespace(type="text", text="All lifts are running."),
+            ]
+        )
+
+        with patch("clarvis_agents.ski_agent.agent.fetch_ski_conditions_impl", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = "mock conditions"
+            result = await agent._get_conditions("What's the ski report?")
+
+        assert result == "72 inches at the base. All lifts are running."
+
+
 class TestSkiAgentPromptBuilding:
     """Test suite for Ski Agent prompt construction."""
 
@@ -207,9 +399,20 @@ class TestSkiAgentPromptBuilding:
         )
 
         # Prompt should include the conditions data and user query
-        assert "72 inches" in prompt
-        assert "What's the snow report?" in prompt
-        assert "<conditions>" in prompt
+        conditions_block, query_block = prompt
+        assert "72 inches" in conditions_block["text"]
+        assert "<conditions>" in conditions_block["text"]
+        assert "What's the snow report?" in query_block["text"]
+
+    def test_build_prompt_caches_conditions_only(self, mock_anthropic_client):
+        """Test that the shared conditions block is cacheable, not the query."""
+        agent = SkiAgent(client=mock_anthropic_client)
+        conditions_block, query_block = agent._build_prompt_with_data(
+            "What's the snow report?", "Base: 72 inches"
+        )
+
+        assert conditions_block["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in query_block
 
 
 class TestCreateSkiAgent:
@@ -1,10 +1,13 @@
 """Tests for Ski Agent configuration."""
 
+import dataclasses
+
 import pytest
 from datetime import datetime, timedelta
 from pathlib import Path
 
 from clarvis_agents.ski_agent.config import (
+    DEFAULT_CONFIG,
     CachedConditions,
     RateLimiter,
     SkiAgentConfig,
@@ -56,6 +59,17 @@ class TestSkiAgentConfig:
         config = SkiAgentConfig(log_dir=custom_path)
         assert config.log_dir == custom_path
 
+    def test_config_log_dir_string_coerced(self):
+        """Test that a string log directory is converted to a Path."""
+        config = SkiAgentConfig(log_dir="/tmp/ski_logs")
+        assert config.log_dir == Path("/tmp/ski_logs")
+
+    def test_config_is_frozen(self):
+        """Test that configs are immutable and the default is shared."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            DEFAULT_CONFIG.max_turns = 1
+        assert DEFAULT_CONFIG == SkiAgentConfig()
+
 
 class TestCachedConditions:
     """Test suite for CachedConditions."""
@@ -131,6 +145,21 @@ class TestRateLimiter:
 
         assert limiter.check_rate_limit() is True  # Should allow again
 
+    def test_rate_limiter_refills_gradually(self):
+        """Test that capacity returns one call at a time, not a whole window."""
+        import time
+
+        limiter = RateLimiter(max_calls=2, time_window=timedelta(milliseconds=400))
+
+        assert limiter.check_rate_limit() is True
+        assert limiter.check_rate_limit() is True
+        assert limiter.check_rate_limit() is False
+
+        time.sleep(0.25)  # Enough to refill one call, not two
+
+        assert limiter.check_rate_limit() is True
+        assert limiter.check_rate_limit() is False
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,10 +1,18 @@
 """Tests for Ski Agent native tools."""
 
+import asyncio
+import gc
+import gzip
+import weakref
+
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import AsyncMock, patch
 import httpx
 
+from clarvis_agents.ski_agent import tools
 from clarvis_agents.ski_agent.tools import (
+    close_http_client,
+    extract_conditions_text,
     fetch_ski_conditions_impl,
     set_conditions_url,
     get_conditions_url,
@@ -32,103 +40,340 @@ class TestConditionsUrlConfig:
         set_conditions_url(DEFAULT_CONDITIONS_URL)
 
 
+class TestCacheTtlFromEnv:
+    """Test suite for reading CLARVIS_SKI_CACHE_TTL."""
+
+    def test_default_when_unset(self, monkeypatch):
+        """Test that the default applies when the variable is unset."""
+        monkeypatch.delenv("CLARVIS_SKI_CACHE_TTL", raising=False)
+        assert tools._cache_ttl_from_env() == 60
+
+    def test_uses_env_value(self, monkeypatch):
+        """Test that a whole number of seconds is used as-is."""
+        monkeypatch.setenv("CLARVIS_SKI_CACHE_TTL", " 300 ")
+        assert tools._cache_ttl_from_env() == 300
+
+    @pytest.mark.parametrize("value", ["abc", "-5", "1.5", ""])
+    def test_invalid_value_falls_back(self, monkeypatch, caplog, value):
+        """Test that invalid values log a warning and use the default."""
+        monkeypatch.setenv("CLARVIS_SKI_CACHE_TTL", value)
+        assert tools._cache_ttl_from_env() == 60
+        assert "CLARVIS_SKI_CACHE_TTL" in caplog.text
+
+
+class TestExtractConditionsText:
+    """Test suite for extract_conditions_text function."""
+
+    def test_keeps_visible_text_only(self):
+        """Test that markup, scripts and styles are dropped."""
+        html = (
+            "<html><head><style>p { color: red; }</style>"
+            "<script>var depth = 0;</script></head><body>"
+            "<div>Base: <b>72&quot;</b></div>\n<p>  Lifts   open </p>"
+            "<table><tr><td>Cascade</td><td>Wind hold</td></tr></table>"
+            "</body></html>"
+        )
+
+        result = extract_conditions_text(html)
+
+        assert result == 'Base: 72"\nLifts open\nCascade Wind hold'
+
+    def test_plain_text_unchanged(self):
+        """Test that input without visible HTML text is returned as-is."""
+        assert extract_conditions_text("Snow: 72 inches") == "Snow: 72 inches"
+        assert extract_conditions_text("<br>") == "<br>"
+
+
+def mock_transport_client(handler):
+    """Patch the tools module's HTTP client to answer requests with handler."""
+    real_client = httpx.AsyncClient
+    return patch(
+        "clarvis_agents.ski_agent.tools.httpx.AsyncClient",
+        side_effect=lambda **kwargs: real_client(
+            transport=httpx.MockTransport(handler), **kwargs
+        ),
+    )
+
+
 class TestFetchSkiConditionsImpl:
     """Test suite for fetch_ski_conditions_impl function."""
 
+    @pytest.fixture(autouse=True)
+    def reset_last_responses(self):
+        """Forget pages from earlier fetches before and after each test."""
+        tools._last_responses.clear()
+        tools._page_cache.clear()
+        yield
+        tools._last_responses.clear()
+        tools._page_cache.clear()
+
     @pytest.mark.asyncio
     async def test_successful_fetch(self):
         """Test successful conditions fetch."""
-        mock_response = MagicMock()
-        mock_response.text = "<html>Snow: 72 inches</html>"
-        mock_response.raise_for_status = MagicMock()
+        requests = []
 
-        with patch("clarvis_agents.ski_agent.tools.httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get = AsyncMock(return_value=mock_response)
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_client.return_value = mock_instance
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, text="<html>Snow: 72 inches</html>")
 
+        with mock_transport_client(handler):
             result = await fetch_ski_conditions_impl()
 
-            assert result == "<html>Snow: 72 inches</html>"
-            mock_instance.get.assert_called_once()
+        assert result == "Snow: 72 inches"
+        assert len(requests) == 1
 
     @pytest.mark.asyncio
     async def test_fetch_with_custom_url(self):
         """Test fetch with custom URL parameter."""
         custom_url = "https://example.com/snow"
-        mock_response = MagicMock()
-        mock_response.text = "Custom data"
-        mock_response.raise_for_status = MagicMock()
+        requests = []
 
-        with patch("clarvis_agents.ski_agent.tools.httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get = AsyncMock(return_value=mock_response)
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_client.return_value = mock_instance
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, text="Custom data")
 
+        with mock_transport_client(handler):
             result = await fetch_ski_conditions_impl(url=custom_url)
 
-            assert result == "Custom data"
-            # Verify custom URL was used
-            call_args = mock_instance.get.call_args
-            assert call_args[0][0] == custom_url
+        assert result == "Custom data"
+        # Verify custom URL was used
+        assert str(requests[0].url) == custom_url
 
     @pytest.mark.asyncio
     async def test_timeout_error(self):
         """Test handling of timeout errors."""
-        with patch("clarvis_agents.ski_agent.tools.httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_client.return_value = mock_instance
 
+        def handler(request):
+            raise httpx.ReadTimeout("Timeout", request=request)
+
+        with mock_transport_client(handler):
             result = await fetch_ski_conditions_impl()
 
-            assert "Error" in result
-            assert "timed out" in result.lower()
+        assert "Error" in result
+        assert "timed out" in result.lower()
 
     @pytest.mark.asyncio
     async def test_http_error(self):
         """Test handling of HTTP errors."""
-        with patch("clarvis_agents.ski_agent.tools.httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_response = MagicMock()
-            mock_response.status_code = 503
-            error = httpx.HTTPStatusError(
-                "Service Unavailable",
-                request=MagicMock(),
-                response=mock_response,
-            )
-            mock_instance.get = AsyncMock(side_effect=error)
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_client.return_value = mock_instance
-
+        with mock_transport_client(lambda request: httpx.Response(503)):
             result = await fetch_ski_conditions_impl()
 
-            assert "Error" in result
-            assert "503" in result
+        assert "Error" in result
+        assert "503" in result
 
     @pytest.mark.asyncio
     async def test_request_error(self):
         """Test handling of connection errors."""
-        with patch("clarvis_agents.ski_agent.tools.httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get = AsyncMock(
-                side_effect=httpx.RequestError("Connection failed")
+
+        def handler(request):
+            raise httpx.ConnectError("Connection failed", request=request)
+
+        with mock_transport_client(handler):
+            result = await fetch_ski_conditions_impl()
+
+        assert "Error" in result
+        assert "connect" in result.lower()
+
+    @pytest.mark.asyncio
+    async def test_http_client_reused_across_fetches(self):
+        """Test that fetches on one event loop share a single HTTP client."""
+        with mock_transport_client(lambda request: httpx.Response(200, text="Snow")) as mock_client:
+            await fetch_ski_conditions_impl()
+            await fetch_ski_conditions_impl()
+            client = tools._get_http_client()
+            await close_http_client()
+
+        mock_client.assert_called_once()
+        assert client.is_closed
+        assert client.timeout.connect == 5.0
+        assert client.timeout.read == 15.0
+
+    def test_http_clients_closed_and_released_with_their_loops(self):
+        """Test that each loop's client is closed and freed when the loop ends."""
+        open_loops = len(tools._http_clients)
+
+        async def handle(reader, writer):
+            # Answer keep-alive requests until the loop shuts down
+            try:
+                while True:
+                    await reader.readuntil(b"\r\n\r\n")
+                    writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 4\r\n\r\nSnow")
+                    await writer.drain()
+            except (asyncio.CancelledError, asyncio.IncompleteReadError):
+                writer.close()
+
+        async def fetch_on_new_loop():
+            server = await asyncio.start_server(handle, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            client = tools._get_http_client()
+            response = await client.get(f"http://127.0.0.1:{port}/")
+            assert response.text == "Snow"
+            server.close()
+            return client, weakref.ref(asyncio.get_running_loop())
+
+        results = [asyncio.run(fetch_on_new_loop()) for _ in range(2)]
+
+        assert results[0][0] is not results[1][0]
+        assert all(client.is_closed for client, _ in results)
+        assert len(tools._http_clients) == open_loops
+
+        loops = [loop for _, loop in results]
+        del results
+        gc.collect()
+        assert all(loop() is None for loop in loops)
+
+    @pytest.mark.asyncio
+    async def test_fresh_page_served_from_cache(self):
+        """Test that fetches within the TTL skip the request entirely."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, text="Snow: 72 inches")
+
+        with mock_transport_client(handler):
+            first = await fetch_ski_conditions_impl()
+            second = await fetch_ski_conditions_impl()
+
+        assert first == second == "Snow: 72 inches"
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_max_age_overrides_ttl(self):
+        """Test that the server's Cache-Control max-age sets the lifetime."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                200, text="Snow", headers={"Cache-Control": "public, max-age=0"}
+            )
+
+        with mock_transport_client(handler):
+            await fetch_ski_conditions_impl()
+            await fetch_ski_conditions_impl()
+
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("directive", ["no-cache", "no-store", "private, no-store"])
+    async def test_no_cache_directives_refetch(self, directive):
+        """Test that no-cache and no-store pages are fetched every time."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                200,
+                text="Snow",
+                headers={"Cache-Control": directive, "ETag": '"v1"'},
+            )
+
+        with mock_transport_client(handler):
+            await fetch_ski_conditions_impl()
+            await fetch_ski_conditions_impl()
+
+        assert len(requests) == 2
+        if "no-store" in directive:
+            assert "If-None-Match" not in requests[1].headers
+            assert not tools._page_cache and not tools._last_responses
+        else:
+            assert requests[1].headers["If-None-Match"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_stale_page_served_on_error(self):
+        """Test that the last good text is returned when a refetch fails."""
+        responses = [httpx.Response(200, text="Snow: 72 inches"), httpx.Response(503)]
+
+        with patch.object(tools, "CACHE_TTL_SECONDS", 0), mock_transport_client(
+            lambda request: responses.pop(0)
+        ):
+            first = await fetch_ski_conditions_impl()
+            second = await fetch_ski_conditions_impl()
+
+        assert first == "Snow: 72 inches"
+        assert second.startswith(tools.STALE_PREFIX)
+        assert second.endswith("\n\nSnow: 72 inches")
+        assert not responses
+
+    @pytest.mark.asyncio
+    async def test_too_stale_page_not_served_on_error(self):
+        """Test that the error is returned once the last good text is too old."""
+        responses = [httpx.Response(200, text="Snow: 72 inches"), httpx.Response(503)]
+
+        with patch.object(tools, "CACHE_TTL_SECONDS", 0), patch.object(
+            tools, "MAX_STALE_SECONDS", -1
+        ), mock_transport_client(lambda request: responses.pop(0)):
+            await fetch_ski_conditions_impl()
+            result = await fetch_ski_conditions_impl()
+
+        assert result.startswith("Error:")
+        assert "503" in result
+
+    @pytest.mark.asyncio
+    async def test_unchanged_page_reuses_previous_text(self):
+        """Test that repeat fetches are conditional and reuse text on a 304."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if len(requests) == 1:
+                return httpx.Response(
+                    200, text="<p>Snow: 72 inches</p>", headers={"ETag": '"v1"'}
+                )
+            return httpx.Response(304)
+
+        with patch.object(tools, "CACHE_TTL_SECONDS", 0), mock_transport_client(handler):
+            first = await fetch_ski_conditions_impl()
+            second = await fetch_ski_conditions_impl()
+
+        assert first == second == "Snow: 72 inches"
+        assert "If-None-Match" not in requests[0].headers
+        assert requests[1].headers["If-None-Match"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_compressed_page_is_decoded(self):
+        """Test that compression is requested and gzip bodies are decoded."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                200,
+                content=gzip.compress(b"<p>Snow: 72 inches</p>"),
+                headers={"Content-Encoding": "gzip"},
             )
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_client.return_value = mock_instance
 
+        with mock_transport_client(handler):
+            result = await fetch_ski_conditions_impl()
+
+        assert result == "Snow: 72 inches"
+        assert "gzip" in requests[0].headers["Accept-Encoding"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("has_h2", [True, False])
+    async def test_http2_enabled_only_with_h2(self, has_h2):
+        """Test that the client asks for HTTP/2 only when h2 is installed."""
+        await close_http_client()
+        with patch.object(tools, "HAS_H2", has_h2), patch(
+            "clarvis_agents.ski_agent.tools.httpx.AsyncClient"
+        ) as mock_client:
+            mock_client.return_value.aclose = AsyncMock()
+            tools._get_http_client()
+            await close_http_client()
+
+        assert mock_client.call_args.kwargs["http2"] is has_h2
+
+    @pytest.mark.asyncio
+    async def test_oversized_page_rejected(self):
+        """Test that pages over the size cap are not read into memory."""
+        oversized = b"x" * (tools.MAX_PAGE_BYTES + 1)
+
+        with mock_transport_client(lambda request: httpx.Response(200, content=oversized)):
             result = await fetch_ski_conditions_impl()
 
-            assert "Error" in result
-            assert "connect" in result.lower()
+        assert "Error" in result
+        assert "too large" in result.lower()
 
 
 class TestSkiToolsServer: